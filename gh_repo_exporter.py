@@ -1,13 +1,19 @@
 from github import Github, GithubException, Auth
+from github.Commit import Commit
+from github.NamedUser import NamedUser
+from github.Repository import Repository
 import pandas as pd
 from tqdm import tqdm
 from google.oauth2.service_account import Credentials
 import gspread
 import yaml
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import partial
 import time
 import os
+import json
 import re
 import argparse
 
@@ -19,8 +25,31 @@ GH_ORG_NAME = os.getenv("GH_ORG_NAME")
 SPREADSHEET_ID = os.getenv("SPREADSHEET_ID")
 GH_SHEET_NAME = os.getenv("GH_SHEET_NAME","GH-Repos")
 GH_TOKEN = os.getenv("GH_TOKEN")
+# Optional comma-separated tokens; repos are spread across them so each token's rate limit is shared
+GH_TOKENS = os.getenv("GH_TOKENS")
 GOOGLE_CREDENTIALS_PATH = os.getenv("GOOGLE_CREDENTIALS_PATH", "service_account.json")
 
+# Rows from the previous run, reused for repos that haven't changed since
+GH_CACHE_PATH = os.getenv("GH_CACHE_PATH", os.path.join(".cache", "gh_repo_cache.json"))
+
+# How often every repo is refetched regardless of the cache (see --full-sweep)
+FULL_SWEEP_INTERVAL = timedelta(days=28)
+
+# Repos not updated within this long are flagged as inactive
+INACTIVE_AFTER = timedelta(days=365)
+
+# REST calls a token should have left before a run starts handing it repos
+RATE_LIMIT_BUFFER = 100
+# Fetched rows are checkpointed to the cache this often, so a crashed run can resume from it
+CACHE_CHECKPOINT_EVERY = 25
+
+# GitHub statuses that mean a real "No" (404: missing file/README/license, 409: empty repository); any
+# other error may be transient, so a row that hit one isn't cached
+MISSING_STATUSES = {404, 409}
+
+# Number of repos fetched concurrently; the work is network-bound, so threads overlap API round trips
+MAX_WORKERS = 12
+
 # Package requirement files to check
 
 PACKAGE_REQUIREMENT_FILES = [
@@ -32,37 +61,213 @@ PACKAGE_REQUIREMENT_FILES = [
     "package.json", "package-lock.json", "yarn.lock", "bower.json",
 ]
 
+# Columns highlighted when their value is "No": red for Standard Files, orange for Recommended Files and filters
+RED_COLUMNS = {
+    "README",
+    "License",
+    ".gitignore",
+    "Package Requirements",
+    "CITATION"
+}
+
+ORANGE_COLUMNS = {
+    ".zenodo.json",
+    "CONTRIBUTING",
+    "AGENTS",
+    "Website Reference",
+    "Dataset",
+    "Model",
+    "Paper Association",
+    "DOI for GitHub Repo"
+}
+
+RED = {"red": 1, "green": 0.5, "blue": 0.5}
+ORANGE = {"red": 1, "green": 0.8, "blue": 0.4}
+FORMAT_COLUMN_COLORS = {
+    **{col_name: RED for col_name in RED_COLUMNS},
+    **{col_name: ORANGE for col_name in ORANGE_COLUMNS},
+}
+# Rounded the same way as conditional_format_key, to recognize rules read back from the sheet
+FORMAT_COLORS = {tuple(round(color[c], 2) for c in ("red", "green", "blue")) for color in (RED, ORANGE)}
+
+# libyaml's C loader when PyYAML was built with it; same safe subset as yaml.safe_load, several times faster
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Regex patterns, compiled once at import instead of on every call
+DOI_RE = re.compile(r"^10\.\d{4,}/\S+$", re.IGNORECASE)  # 10.<4+ digits>/<suffix>
+DOI_BADGE_RE = re.compile(r"\[!\[DOI\]\(https?://zenodo\.org/badge/\d+\.svg\)\]\((https?://\S+?)\)", re.IGNORECASE)
+# README link patterns are matched against casefolded text, so they are written lowercase without re.IGNORECASE
+HF_DATASET_RE = re.compile(r"https?://huggingface\.co/datasets/[^\s]+")
+HF_COLLECTION_RE = re.compile(r"https?://huggingface\.co/collections/[^\s]+")
+HF_MODEL_RE = re.compile(r"https?://huggingface\.co/imageomics/[a-z0-9_\-./]+")
+GITHUB_DATA_DIR_RE = re.compile(r"https?://github\.com/imageomics/([^/\s]+)/tree/main/data[^\s]*")  # group 1: repo name
+# One alternation over the paper hosts, so a URL is checked in a single search instead of one per host
+PAPER_HOSTS = (
+    "arxiv.org",
+    "doi.org",
+    "link.springer.com",
+    "www.nature.com",
+    "dl.acm.org",
+    "ieeexplore.ieee.org",
+    "www.researchgate.net",
+)
+PAPER_URL_RE = re.compile(
+    rf"https?://(?:{'|'.join(re.escape(host) for host in PAPER_HOSTS)})/[A-Za-z0-9_\-./]+",
+    re.IGNORECASE,
+)
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\((.*?)\)")  # [<name>](<url>)
+DISPLAY_NAME_RE = re.compile(r'"([^"]+)"\)$')  # repo-name from =HYPERLINK(..., "repo-name")
+
+# GraphQL fields covering the file/metadata checks in get_repo_info, so each repo costs one request (or a
+# share of one batched request) instead of a REST call per file, README, license, language, and branch count.
+# "root" lists the top-level entries; nested files (e.g., packrat/packrat.lock) need their own alias.
+REPO_METADATA_FRAGMENT = """
+fragment RepoMetadata on Repository {
+  licenseInfo { spdxId }
+  primaryLanguage { name }
+  refs(refPrefix: "refs/heads/") { totalCount }
+  root: object(expression: "HEAD:") { ... on Tree { entries { name } } }
+  readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+  citation: object(expression: "HEAD:CITATION.cff") { ... on Blob { text } }
+  packrat: object(expression: "HEAD:packrat/packrat.lock") { oid }
+}
+"""
+
+REPO_METADATA_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { ...RepoMetadata }
+}
+""" + REPO_METADATA_FRAGMENT
+
+# Repos per batched GraphQL query; keeps responses (which carry README/CITATION text) reasonably sized
+GRAPHQL_BATCH_SIZE = 20
+
 # Helper Functions
-def has_file(repo, *paths: str) -> str:
+def note_fetch_error(errors: list[str] | None, what: str, e: Exception) -> None:
+    # The fetch helpers fall back to "No"/"N/A" on any error; this records the ones that aren't a real
+    # missing file or empty repo in `errors` (when given), so the caller can tell them apart
+    if errors is not None and getattr(e, "status", None) not in MISSING_STATUSES:
+        errors.append(f"{what}: {type(e).__name__}: {e}")
+
+def has_file(repo, *paths: str, errors: list[str] | None = None) -> str:
     for path in paths:
         try:
             if repo.get_contents(path):
                 return "Yes"
-        except GithubException:
+        except GithubException as e:
+            note_fetch_error(errors, path, e)
             continue
     return "No"
 
-def has_readme(repo) -> str:
+def get_readme_text(repo, errors: list[str] | None = None) -> str | None:
+    # Returns None when the repo has no README
     try:
-        if repo.get_readme():
-            return "Yes"
-    except GithubException:
-        return "No"
+        return repo.get_readme().decoded_content.decode("utf-8", errors="ignore")
+    except Exception as e:
+        note_fetch_error(errors, "README", e)
+        return None
 
-def has_license(repo) -> str:
+def has_license(repo, errors: list[str] | None = None) -> str:
     try:
         if repo.get_license():
             return "Yes"
-    except GithubException:
+    except GithubException as e:
+        note_fetch_error(errors, "license", e)
         return "No"
         
-def get_num_branches(repo) -> int | str:
+def fetch_repo_metadata(repo) -> dict | None:
+    """
+    Fetches the file and metadata checks for a repo in a single GraphQL request.
+
+    Returns None if the query fails (GraphQL requires an authenticated client), in which case
+    get_repo_info falls back to the REST helpers.
+    """
+    owner, name = repo.full_name.split("/", 1)
+    try:
+        _, response = repo._requester.graphql_query(REPO_METADATA_QUERY, {"owner": owner, "name": name})
+        node = response["data"]["repository"]
+    except Exception as e:
+        tqdm.write(f"Warning: GraphQL query failed for {repo.name}, falling back to REST: {e}")
+        return None
+
+    return parse_repo_metadata(node)
+
+def fetch_repos_metadata(requester, owner: str, names: list[str]) -> dict[str, dict]:
+    """
+    Fetches the file and metadata checks for several repos of one owner in a single GraphQL request,
+    aliasing one `repository` field per repo.
+
+    Returns a dict of repo name -> metadata; repos missing from it (failed query or inaccessible repo)
+    should fall back to fetch_repo_metadata() or the REST helpers.
+    """
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $owner, name: $n{i}) {{ ...RepoMetadata }}" for i in range(len(names))
+    )
+    params = "".join(f", $n{i}: String!" for i in range(len(names)))
+    query = f"query($owner: String!{params}) {{\n{fields}\n}}\n" + REPO_METADATA_FRAGMENT
+    variables = {"owner": owner, **{f"n{i}": name for i, name in enumerate(names)}}
+
+    try:
+        _, response = requester.graphql_query(query, variables)
+    except Exception as e:
+        # PyGithub raises if any alias errors (e.g., a repo the token can't see), but the error still
+        # carries the other repos' data
+        response = getattr(e, "data", None)
+        if not isinstance(response, dict) or not response.get("data"):
+            tqdm.write(f"Warning: Batched GraphQL query failed for {len(names)} repos: {e}")
+            return {}
+
+    data = response.get("data") or {}
+
+    return {
+        name: parse_repo_metadata(data[f"r{i}"])
+        for i, name in enumerate(names)
+        if data.get(f"r{i}")
+    }
+
+def parse_repo_metadata(node: dict) -> dict:
+    # Maps a RepoMetadata GraphQL node to the values get_repo_info reads
+    root = node.get("root") or {}
+    files = {entry["name"] for entry in root.get("entries", [])}
+    if node.get("packrat"):
+        files.add("packrat/packrat.lock")
+
+    return {
+        "files": files,
+        "readme": (node.get("readme") or {}).get("text"),
+        "citation": (node.get("citation") or {}).get("text"),
+        "license": "Yes" if node.get("licenseInfo") else "No",
+        "language": (node.get("primaryLanguage") or {}).get("name") or "N/A",
+        "branches": (node.get("refs") or {}).get("totalCount", "N/A"),
+    }
+
+def list_root_files(repo, errors: list[str] | None = None) -> set[str] | None:
+    # Root paths of the default branch from one git tree call, so each file check is a set lookup instead
+    # of a contents request; None (e.g., empty repo or a failed call) sends the checks back to has_file,
+    # which records its own errors, so a failed listing alone doesn't make the row uncacheable
+    try:
+        files = {entry.path for entry in repo.get_git_tree(repo.default_branch).tree}
+    except GithubException:
+        return None
+
+    # Nested requirement files are only looked up when their directory exists
+    if "packrat" in files and has_file(repo, "packrat/packrat.lock", errors=errors) == "Yes":
+        files.add("packrat/packrat.lock")
+    return files
+
+def has_listed_file(files: set[str], *paths: str) -> str:
+    return "Yes" if any(path in files for path in paths) else "No"
+
+def get_num_branches(repo, errors: list[str] | None = None) -> int | str:
+    # REST fallback only (the GraphQL path reads refs.totalCount). PyGithub's totalCount is already a
+    # single per_page=1 request that reads the page count from the Link rel="last" header.
     try:
         return repo.get_branches().totalCount
-    except:
+    except Exception as e:
+        note_fetch_error(errors, "branches", e)
         return "N/A"
     
-def get_repo_creator(repo, existing_df: pd.DataFrame = None) -> str:
+def get_repo_creator(repo, existing_df: pd.DataFrame = None, errors: list[str] | None = None) -> str:
     try:
         
          # Check if repo already exists in sheet. If so, reuse existing value instead of slow search
@@ -90,74 +295,83 @@ def get_repo_creator(repo, existing_df: pd.DataFrame = None) -> str:
         if not total:
             return "N/A"
 
-        # Avoid loading the entire history into memory: fetch only the last page.
-        per_page = getattr(getattr(repo, "_requester", None), "per_page", 30) or 30
-        last_page = (total - 1) // per_page
-        oldest_page = commits.get_page(last_page)
-        oldest_commit = oldest_page[-1] if oldest_page else None
+        # With per_page=1, page N of the history holds exactly the Nth-newest commit, so the oldest
+        # one is a single-commit fetch instead of a full last page at the client's page size
+        headers, data = repo._requester.requestJsonAndCheck(
+            "GET", f"{repo.url}/commits", parameters={"per_page": 1, "page": total}
+        )
+        oldest_commit = Commit(repo._requester, headers, data[0], completed=True) if data else None
         author = oldest_commit.author if oldest_commit else None
         return f"{author.name} ({author.login})" if author else "N/A"
     
     except Exception as e:
         tqdm.write(f"Warning: Could not determine creator for {repo.name}: {e}")
+        note_fetch_error(errors, "creator", e)
         return "N/A"
 
-def get_top_contributors(repo, top_n: int = 4) -> str:
+def get_top_contributors(
+    repo, top_n: int = 4, with_lines_changed: bool = True, errors: list[str] | None = None
+) -> str:
+    # The stats endpoint is computed on demand (202 + retries); the plain contributors list is one fast call
+    if not with_lines_changed:
+        return get_top_contributors_commits(repo, top_n, errors)
+
     try:
-        # Primary approach using get_stats_contributors() for lines of code ranking
-        stats = None
-        for _ in range(3):
-            stats = repo.get_stats_contributors()
-            if stats:
-                break
-            time.sleep(20)
+        # Primary approach using get_stats_contributors() for lines of code ranking.
+        # PyGithub's requester already re-polls 202 "computing" responses until the stats are ready,
+        # so an empty result here means there are no stats (e.g. empty repo) and is not worth retrying.
+        stats = repo.get_stats_contributors()
 
         if not stats:
             # Fallback: use commit-based approach if get_stats_contributors() fails
             tqdm.write(f"  Falling back to commit-based for {repo.name}...")
-            return get_top_contributors_commits(repo, top_n)
+            return get_top_contributors_commits(repo, top_n, errors)
 
+        # Rank before touching author.name: the stats only carry logins, so each name is a lazy GET /users
+        # call and should be paid for the top_n contributors only, not everyone in the stats
         contributors = []
         for contributor in stats:
-            total_additions = sum(week.a for week in contributor.weeks)
-            total_deletions = sum(week.d for week in contributor.weeks)
-            total_changes = total_additions + total_deletions
-            contributors.append((contributor.author.name, contributor.author.login, total_changes))
+            total_changes = sum(week.a + week.d for week in contributor.weeks)
+            contributors.append((contributor.author, total_changes))
 
-        top_n_contributors = sorted(contributors, key=lambda x: x[2], reverse=True)[:top_n]
-        return ", ".join([f"{name} ({login})" for name, login, _ in top_n_contributors])
+        top_n_contributors = sorted(contributors, key=lambda x: x[1], reverse=True)[:top_n]
+        return ", ".join([f"{author.name} ({author.login})" for author, _ in top_n_contributors])
 
-    except Exception:
+    except Exception as e:
         # Fallback: use commit-based approach if get_stats_contributors() raises an exception
         tqdm.write(f"  Falling back to commit-based for {repo.name}...")
-        return get_top_contributors_commits(repo, top_n)
+        note_fetch_error(errors, "contributor stats", e)
+        return get_top_contributors_commits(repo, top_n, errors)
 
-def get_top_contributors_commits(repo, top_n: int = 4) -> str:
+def get_top_contributors_commits(repo, top_n: int = 4, errors: list[str] | None = None) -> str:
     # Fallback method using commit count when get_stats_contributors() fails
     try:
-        contributors = repo.get_contributors()
-        top_n_contributors = []
-
-        for i, contributor in enumerate(contributors):
-            if i >= top_n:
-                break
-            top_n_contributors.append(f"{contributor.name} ({contributor.login})")
+        # The list is already sorted by commit count, so one page of exactly top_n is enough; iterating
+        # get_contributors() would pull a full page at the client's page size (100) to read 4 entries
+        headers, data = repo._requester.requestJsonAndCheck(
+            "GET", f"{repo.url}/contributors", parameters={"per_page": top_n}
+        )
+        contributors = [NamedUser(repo._requester, headers, attributes, completed=False) for attributes in data or []]
+        top_n_contributors = [f"{contributor.name} ({contributor.login})" for contributor in contributors]
 
         result = ", ".join(top_n_contributors) if top_n_contributors else "N/A"
         return f"{result} (commit-based)" if result != "N/A" else "N/A"
 
-    except Exception:
+    except Exception as e:
+        note_fetch_error(errors, "contributors", e)
         return "N/A"
     
-def is_inactive(repo) -> str:
+def get_inactive_cutoff() -> datetime:
+    return datetime.now(timezone.utc) - INACTIVE_AFTER
+
+def is_inactive(repo, cutoff: datetime | None = None) -> str:
+    # main() computes the cutoff once per run, so every repo is judged against the same instant
     try:
         updated = repo.updated_at
         if updated.tzinfo is None:
             updated = updated.replace(tzinfo=timezone.utc)
 
-        one_year_ago = datetime.now(timezone.utc) - timedelta(days=365)
-
-        return "Yes" if updated < one_year_ago else "No"
+        return "Yes" if updated < (cutoff or get_inactive_cutoff()) else "No"
     except Exception:
         return "No"
     
@@ -176,7 +390,7 @@ def is_valid_doi(doi: str | None) -> bool:
     doi_lower = doi.lower() 
 
     # Expected DOI format: 10.<4+ digits>/<suffix>
-    if not re.match(r"^10\.\d{4,}/\S+$", doi, re.IGNORECASE):
+    if not DOI_RE.match(doi):
         return False
     
     # Must be a known repo DOI; Zenodo is used for Github repos.
@@ -186,19 +400,30 @@ def is_valid_doi(doi: str | None) -> bool:
     return True
 
 
-def has_doi(repo, readme: str = "") -> str:
+def has_doi(repo, readme: str = "", citation: str | None = None, errors: list[str] | None = None) -> str:
     """
     Checks whether a repo contains a valid DOI in its CITATION.cff file, or a Zenodo DOI badge in its README. 
     
+    The CITATION.cff text is fetched from the repo unless already provided; an empty string means the
+    repo has no CITATION.cff.
+
     Returns a DOI link if found, otherwise "No"
     """
     
     # Retrieving CITATION.cff file from repo
+    if citation is None:
+        try:
+            content_file = repo.get_contents("CITATION.cff")
+            citation = content_file.decoded_content.decode("utf-8")
+        except Exception as e:
+            note_fetch_error(errors, "CITATION.cff", e)
+            citation = ""
+
     try:
-        content_file = repo.get_contents("CITATION.cff")
-        citation = content_file.decoded_content.decode("utf-8")
+        if not citation:
+            raise FileNotFoundError("CITATION.cff")
 
-        data = yaml.safe_load(citation)
+        data = yaml.load(citation, Loader=YAML_SAFE_LOADER)
         if not isinstance(data, dict):
             return "No"
 
@@ -248,11 +473,7 @@ def has_doi(repo, readme: str = "") -> str:
        
     try:
         if readme:
-            badge_match = re.search(
-                r"\[!\[DOI\]\(https?://zenodo\.org/badge/\d+\.svg\)\]\((https?://\S+?)\)",
-                readme,
-                re.IGNORECASE,
-            )
+            badge_match = DOI_BADGE_RE.search(readme)
             if badge_match:
                 return badge_match.group(1).rstrip(").],};:>\"'")
     except Exception:
@@ -262,15 +483,18 @@ def has_doi(repo, readme: str = "") -> str:
     
         
 def get_dataset(readme: str, repo_name: str) -> str:
-    try:
-        patterns = [
-            r"https?://huggingface\.co/datasets/[^\s]+",
-            rf"https?://github\.com/imageomics/{repo_name}/tree/main/data[^\s]*",
-            r"https?://huggingface\.co/collections/[^\s]+",
-        ]
+    # Expects readme and repo_name already casefolded
+    # Every pattern needs one of these hosts, and a substring check is far cheaper than the regex scans
+    if "huggingface.co/" not in readme and "github.com/" not in readme:
+        return "No"
 
-        for pattern in patterns:
-            match = re.search(pattern, readme, flags=re.IGNORECASE)
+    try:
+        for pattern in (HF_DATASET_RE, GITHUB_DATA_DIR_RE, HF_COLLECTION_RE):
+            if pattern is GITHUB_DATA_DIR_RE:
+                # Only this repo's own data directory counts
+                match = next((m for m in pattern.finditer(readme) if m.group(1) == repo_name), None)
+            else:
+                match = pattern.search(readme)
             if match:
                 url = match.group(0)
 
@@ -282,10 +506,13 @@ def get_dataset(readme: str, repo_name: str) -> str:
         return "No"
 
 def get_model(readme: str) -> str:
+    # Expects readme already casefolded
+    if "huggingface.co/imageomics/" not in readme:
+        return "No"
+
     try:
         # Check for Hugging Face model link in README
-        hf_pattern = r"https?://huggingface\.co/imageomics/[A-Za-z0-9_\-./]+"
-        hf_match = re.search(hf_pattern, readme)
+        hf_match = HF_MODEL_RE.search(readme)
 
         if hf_match:
             url = hf_match.group(0).rstrip(").],};:>\"'")
@@ -296,48 +523,31 @@ def get_model(readme: str) -> str:
         return "No"
     
 def get_primary_language(repo) -> str:
+    # The org listing already carries GitHub's primary language (the one with the most bytes), so this
+    # needs no languages request
     try:
-        languages = repo.get_languages()
-        if not languages:
-            return "N/A"
-        
-        return max(languages, key=languages.get)
+        return repo.language or "N/A"
     except Exception:
         return "N/A"
 
 def get_associated_paper(readme: str, homepage: str | None = None) -> str:
     try:
-        url_patterns = [
-            r"https?://arxiv\.org/[A-Za-z0-9_\-./]+",
-            r"https?://doi\.org/[A-Za-z0-9_\-./]+",
-            r"https?://link\.springer\.com/[A-Za-z0-9_\-./]+",
-            r"https?://www\.nature\.com/[A-Za-z0-9_\-./]+",
-            r"https?://dl\.acm\.org/[A-Za-z0-9_\-./]+",
-            r"https?://ieeexplore\.ieee\.org/[A-Za-z0-9_\-./]+",
-            r"https?://www\.researchgate\.net/[A-Za-z0-9_\-./]+",
-        ]
-
-        # checks for [<name>](<url>)
-        markdown_link_pattern = r"\[([^\]]+)\]\((.*?)\)"
-
-        # Check README for paper-associated links
-        for label, url in re.findall(markdown_link_pattern, readme):
+        # Check README for paper-associated links; without any "](" there are no markdown links to scan
+        links = MARKDOWN_LINK_RE.findall(readme) if "](" in readme else []
+        for label, url in links:
             # Only accept label == "paper" or "arXiv" (case-insensitive)
             if label.strip().lower() not in {"paper", "arxiv"}:
                 continue
 
             # Check if URL matches a paper source
-            for pattern in url_patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    cleaned = url.rstrip(").],};:>\"'")
-                    return f'=HYPERLINK("{cleaned}", "Yes")'
+            if PAPER_URL_RE.search(url):
+                cleaned = url.rstrip(").],};:>\"'")
+                return f'=HYPERLINK("{cleaned}", "Yes")'
                 
         # Check About section URL as fallback  
-        if homepage:
-            for pattern in url_patterns:
-                if re.search(pattern, homepage, re.IGNORECASE):
-                    cleaned = homepage.rstrip(").],};:>\"'")
-                    return f'=HYPERLINK("{cleaned}", "Yes")'
+        if homepage and PAPER_URL_RE.search(homepage):
+            cleaned = homepage.rstrip(").],};:>\"'")
+            return f'=HYPERLINK("{cleaned}", "Yes")'
         return "No"
     except Exception:
         return "No"
@@ -363,47 +573,231 @@ def get_website_reference(homepage: str | None) -> str:
     except Exception:
         return "No"
      
-def get_repo_info(repo, existing_df: pd.DataFrame = None) -> dict[str, str | int]:
-    try:
-        readme_content_lower = repo.get_readme().decoded_content.decode("utf-8", errors="ignore").lower()
-    except Exception:
-        readme_content_lower = ""
+def parse_tokens(value: str | None) -> list[str]:
+    # Comma-separated tokens, blanks and duplicates dropped, order kept
+    tokens = (token.strip() for token in (value or "").split(","))
+    return list(dict.fromkeys(token for token in tokens if token))
+
+def bind_repo(repo, gh: Github):
+    # Rebuild a listed repo on another client so its API calls use that client's token; reuses the
+    # listing data as-is rather than refetching the repo
+    return Repository(gh.requester, repo._headers, repo._rawData, completed=False)
 
+def select_clients(clients: list, buffer: int = RATE_LIMIT_BUFFER) -> list:
+    """
+    Returns the clients whose token has at least `buffer` REST calls left this hour, so a nearly exhausted
+    token isn't handed a share of the repos. If every token is below the buffer, waits for the earliest
+    reset and returns that client.
+
+    A client whose limit can't be read is kept; PyGithub's retry still waits out limits hit mid-run.
+    """
+    limits = []
+    for gh in clients:
+        try:
+            limits.append((gh, gh.get_rate_limit().resources.core))
+        except Exception:
+            limits.append((gh, None))
+
+    ready = [gh for gh, core in limits if core is None or core.remaining >= buffer]
+    if ready:
+        return ready
+
+    gh, core = min(limits, key=lambda limit: limit[1].reset)
+    wait = (core.reset - datetime.now(timezone.utc)).total_seconds()
+    if wait > 0:
+        print(f"All tokens have fewer than {buffer} requests left; waiting {int(wait)}s for the rate limit to reset")
+        time.sleep(wait + 1)
+    return [gh]
+
+def get_listing_fields(repo, cutoff: datetime | None = None) -> dict[str, str | int]:
+    # Fields read straight off the repo object returned by org.get_repos(); these cost no extra requests
     return {
         "Repository Name": f'=HYPERLINK("{repo.html_url}", "{repo.name}")',
         "Description": repo.description or "N/A",
         "Date Created": repo.created_at.strftime("%Y-%m-%d"),
         "Last Updated": repo.updated_at.strftime("%Y-%m-%d"),
-        "Created By": get_repo_creator(repo, existing_df),
-        "Top 4 Contributors (lines of code changes)": get_top_contributors(repo, 4),
         "Stars": repo.stargazers_count,
-        "# of Branches": get_num_branches(repo),
-        "README": has_readme(repo),
-        "License": has_license(repo),
-        ".gitignore": has_file(repo, ".gitignore"),
-        "Package Requirements": has_file(repo, *PACKAGE_REQUIREMENT_FILES),
-        "CITATION": has_file(repo, "CITATION.cff"),
-        ".zenodo.json": has_file(repo, ".zenodo.json"),
-        "CONTRIBUTING": has_file(repo, "CONTRIBUTING.md"),
-        "AGENTS": has_file(repo, "AGENTS.md"),
-        "Language": get_primary_language(repo),
         "Visibility": "Private" if repo.private else "Public",
         "Is Fork": "Yes" if repo.fork else "No",
         "Has Forks": repo.forks_count if repo.forks_count > 0 else "No",
         "Archived": "Yes" if repo.archived else "No",
-        "Inactive": is_inactive(repo),
+        "Inactive": is_inactive(repo, cutoff),
         "Website Reference": get_website_reference(repo.homepage),
-        "Dataset": get_dataset(readme_content_lower, repo.name.lower()),
-        "Model": get_model(readme_content_lower),
+    }
+
+def get_repo_fingerprint(repo, with_lines_changed: bool = True) -> dict[str, str | bool | None]:
+    # Covers what the cached (non-listing) columns derive from: files, contributors, and branches move with
+    # pushed_at, and the homepage feeds "Paper Association". updated_at is left out on purpose: it also
+    # moves on stars and other listing changes, which get_cached_repo_info refreshes anyway.
+    # with_lines_changed is the contributor ranking mode, so rows ranked the other way aren't reused.
+    return {
+        "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
+        "default_branch": repo.default_branch,
+        "homepage": repo.homepage,
+        "with_lines_changed": with_lines_changed,
+    }
+
+def load_repo_cache(path: str) -> dict:
+    """
+    Loads the cache saved by the previous run: `repos` maps repo full name to its fingerprint and row,
+    and `last_full_sweep` is when every repo was last fetched without using the cache.
+
+    Returns an empty cache if the file is missing or unreadable.
+    """
+    empty = {"last_full_sweep": None, "repos": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty
+
+    if not isinstance(cache, dict) or not isinstance(cache.get("repos"), dict):
+        return empty
+    return {"last_full_sweep": cache.get("last_full_sweep"), "repos": cache["repos"]}
+
+def is_full_sweep_due(cache: dict, now: datetime | None = None) -> bool:
+    # Periodically refetch everything so a change the fingerprint missed can't stay cached forever
+    last_full_sweep = cache.get("last_full_sweep")
+    if not last_full_sweep:
+        return True
+
+    try:
+        last_full_sweep = datetime.fromisoformat(last_full_sweep)
+    except (TypeError, ValueError):
+        return True
+
+    now = now or datetime.now(timezone.utc)
+    return now - last_full_sweep >= FULL_SWEEP_INTERVAL
+
+def save_repo_cache(path: str, cache: dict) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temp file first so an interrupted run can't leave a truncated cache behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+def get_cached_repo_info(
+    repo, cache: dict[str, dict], cutoff: datetime | None = None, with_lines_changed: bool = True
+) -> dict[str, str | int] | None:
+    """
+    Returns the previous run's row for a repo if it hasn't been pushed to (or had its homepage or default
+    branch changed) since and was ranked with the same contributor mode, with the listing fields refreshed
+    (stars, forks, inactivity, etc. change without a push).
+
+    Returns None if the repo needs to be fetched.
+    """
+    entry = cache.get(repo.full_name)
+    if not entry or entry.get("fingerprint") != get_repo_fingerprint(repo, with_lines_changed):
+        return None
+
+    return {**entry["row"], **get_listing_fields(repo, cutoff)}
+
+def get_repo_info(
+    repo,
+    existing_df: pd.DataFrame = None,
+    metadata: dict | None = None,
+    with_lines_changed: bool = True,
+    cutoff: datetime | None = None,
+    errors: list[str] | None = None,
+) -> dict[str, str | int]:
+    """
+    Collects the exported row for a repo. When `metadata` from fetch_repo_metadata() is given, the file
+    and metadata checks are read from it; otherwise they are REST calls, with file checks read from one
+    git tree listing.
+
+    With `with_lines_changed=False`, top contributors are ranked by commit count instead of lines changed.
+    `cutoff` is the inactivity cutoff from get_inactive_cutoff(), computed on each call if omitted.
+    Fetch errors other than a missing file or empty repo are appended to `errors` (when given); the
+    row's "No"/"N/A" values may then be wrong, so main() doesn't cache it.
+    """
+    if metadata is None:
+        readme_text = get_readme_text(repo, errors)
+        license_found = has_license(repo, errors)
+        num_branches = get_num_branches(repo, errors)
+        language = get_primary_language(repo)
+
+        root_files = list_root_files(repo, errors)
+        if root_files is None:
+            check_file = partial(has_file, repo, errors=errors)
+            citation = None
+        else:
+            check_file = partial(has_listed_file, root_files)
+            # Without CITATION.cff in the listing, has_doi can skip fetching it
+            citation = None if "CITATION.cff" in root_files else ""
+    else:
+        readme_text = metadata["readme"]
+
+        # The GraphQL query only reads README.md; other README names/locations need the REST lookup
+        if readme_text is None:
+            readme_text = get_readme_text(repo, errors)
+
+        license_found = metadata["license"]
+        num_branches = metadata["branches"]
+        language = metadata["language"]
+        check_file = partial(has_listed_file, metadata["files"])
+        citation = metadata["citation"] or ""
+
+    # README is fetched once and casefolded once; the link helpers are skipped when there is no text to scan
+    readme_content_lower = readme_text.casefold() if readme_text else ""
+    if readme_content_lower:
+        dataset = get_dataset(readme_content_lower, repo.name.casefold())
+        model = get_model(readme_content_lower)
+    else:
+        dataset = model = "No"
+
+    return {
+        **get_listing_fields(repo, cutoff),
+        "Created By": get_repo_creator(repo, existing_df, errors),
+        "Top 4 Contributors (lines of code changes)": get_top_contributors(repo, 4, with_lines_changed, errors),
+        "# of Branches": num_branches,
+        "README": "Yes" if readme_text is not None else "No",
+        "License": license_found,
+        ".gitignore": check_file(".gitignore"),
+        "Package Requirements": check_file(*PACKAGE_REQUIREMENT_FILES),
+        "CITATION": check_file("CITATION.cff"),
+        ".zenodo.json": check_file(".zenodo.json"),
+        "CONTRIBUTING": check_file("CONTRIBUTING.md"),
+        "AGENTS": check_file("AGENTS.md"),
+        "Language": language,
+        "Dataset": dataset,
+        "Model": model,
         "Paper Association": get_associated_paper(readme_content_lower, repo.homepage),
-        "DOI for GitHub Repo": has_doi(repo,  readme_content_lower),
+        "DOI for GitHub Repo": has_doi(repo,  readme_content_lower, citation, errors),
     }
 
-def extract_display_name(val: str) -> str:
-    match = re.search(r'"([^"]+)"\)$', val) # regex to extract the repo-name from "=HYPERLINK(..., "repo-name")"
-    return match.group(1) if match else val
+def extract_display_names(values: pd.Series) -> pd.Series:
+    # Extracts repo-name from "=HYPERLINK(..., "repo-name")" for a whole column in one pandas pass
+    # (instead of a Python-level regex call per value); values that aren't formulas are kept as-is
+    values = values.fillna("").astype(str)
+    return values.str.extract(DISPLAY_NAME_RE, expand=False).fillna(values)
 
-def update_google_sheet(df: pd.DataFrame, spreadsheet_id: str, sheet_name: str, creds_path: str) -> None:
+def get_conditional_formats(sheet) -> list[dict]:
+    metadata = sheet.spreadsheet.fetch_sheet_metadata(
+        params={"fields": "sheets(properties(sheetId),conditionalFormats(ranges,booleanRule))"}
+    )
+    for sheet_metadata in metadata.get("sheets", []):
+        if sheet_metadata.get("properties", {}).get("sheetId") == sheet.id:
+            return sheet_metadata.get("conditionalFormats", [])
+    return []
+
+def conditional_format_key(rule: dict) -> tuple:
+    # Identifies a rule by its ranges, condition, and color; colors are rounded because the API returns
+    # them as floats and omits zero components
+    boolean_rule = rule.get("booleanRule", {})
+    condition = boolean_rule.get("condition", {})
+    color = boolean_rule.get("format", {}).get("backgroundColor", {})
+    ranges = tuple(sorted(
+        (rng.get("startRowIndex"), rng.get("endRowIndex"), rng.get("startColumnIndex"), rng.get("endColumnIndex"))
+        for rng in rule.get("ranges", [])
+    ))
+    values = tuple(value.get("userEnteredValue") for value in condition.get("values", []))
+    return ranges, condition.get("type"), values, tuple(round(color.get(c, 0), 2) for c in ("red", "green", "blue"))
+
+def open_worksheet(spreadsheet_id: str, sheet_name: str, creds_path: str):
     # Authenticate Google API
     creds = Credentials.from_service_account_file(
         creds_path,
@@ -413,12 +807,33 @@ def update_google_sheet(df: pd.DataFrame, spreadsheet_id: str, sheet_name: str,
         ]
     )
 
-    client = gspread.authorize(creds)
-    sheet = client.open_by_key(spreadsheet_id).worksheet(sheet_name)
+    # Retries Sheets requests that hit the per-minute quota (429) or a 5xx with exponential backoff,
+    # instead of failing the whole export after every repo has been fetched
+    client = gspread.authorize(creds, http_client=gspread.BackOffHTTPClient)
+    return client.open_by_key(spreadsheet_id).worksheet(sheet_name)
+
+def is_exporter_format_rule(key: tuple) -> bool:
+    # True for a "No" highlight in one of the exporter's colors, i.e., a rule this script created
+    _, condition_type, values, color = key
+    return condition_type == "TEXT_EQ" and values == ("No",) and color in FORMAT_COLORS
+
+def update_google_sheet(
+    df: pd.DataFrame,
+    spreadsheet_id: str,
+    sheet_name: str,
+    creds_path: str,
+    sheet=None,
+    existing: list[list[str]] | None = None,
+) -> None:
+    # main() passes the worksheet and values it already read, so the sheet is opened and read once per run
+    if sheet is None:
+        sheet = open_worksheet(spreadsheet_id, sheet_name, creds_path)
+    if existing is None:
+        existing = sheet.get_all_values()
 
     # Pull current header
     HEADER_ROW_INDEX = 2
-    header = sheet.row_values(HEADER_ROW_INDEX)
+    header = existing[HEADER_ROW_INDEX - 1] if len(existing) >= HEADER_ROW_INDEX else []
 
     # Find 
     try: 
@@ -427,127 +842,189 @@ def update_google_sheet(df: pd.DataFrame, spreadsheet_id: str, sheet_name: str,
         raise ValueError('Sheet is missing "Repository Name" column')
 
     # Build a dict of repo name -> index
-    existing = sheet.get_all_values()
     data_rows = existing[HEADER_ROW_INDEX:]
-    name_to_row = {}
+    row_numbers = []
+    sheet_names = []
     for offset, row in enumerate(data_rows, start=HEADER_ROW_INDEX + 1):
         if len(row) <= repo_col_index: # if row of data fetched is missing repo name column, ignore the row
             continue
 
-        sheet_repo_name = extract_display_name(row[repo_col_index]) # hardcoded to check for "Repository Name" column in row 0
-        name_to_row[sheet_repo_name] = offset
+        row_numbers.append(offset)
+        sheet_names.append(row[repo_col_index])
 
-    batch_body = []
-    for _, row in df.iterrows():
-        repo_name = extract_display_name(row["Repository Name"])
+    name_to_row = dict(zip(extract_display_names(pd.Series(sheet_names, dtype=object)), row_numbers))
+
+    # Group the header into runs of adjacent columns present in df, so each row is written as one range
+    # per run instead of one range per cell; columns not in df (e.g., manual notes) are left untouched
+    column_runs = []
+    for col_idx, col_name in enumerate(header, start=1):
+        if col_name not in df.columns:
+            continue
+
+        if column_runs and column_runs[-1][-1][0] == col_idx - 1:
+            column_runs[-1].append((col_idx, col_name))
+        else:
+            column_runs.append([(col_idx, col_name)])
+
+    # Resolve each run's column letters once; only the row number changes per range
+    run_ranges = [
+        (
+            gspread.utils.rowcol_to_a1(1, run[0][0])[:-1],
+            gspread.utils.rowcol_to_a1(1, run[-1][0])[:-1],
+            [col_name for _, col_name in run],
+        )
+        for run in column_runs
+    ]
+
+    # New repos go after the last existing row
+    next_row_idx = len(existing) + 1
+
+    # Resolve each repo's target row first, so rows that land next to each other can share a range
+    row_targets = []
+    display_names = extract_display_names(df["Repository Name"])
+    # Plain dicts per row; iterrows() would build a pandas Series for every row just to read a few cells
+    for repo_name, row in zip(display_names, df.to_dict("records")):
 
         # Determine row index
         if repo_name in name_to_row:
             row_idx = name_to_row[repo_name]
         else:
-            row_idx = len(existing) + 1
-            existing.append([""] * len(header))
+            row_idx = next_row_idx
+            next_row_idx += 1
 
-        # Create (range, value) for each column individually
-        for col_idx, col_name in enumerate(header, start=1):
-            if col_name not in df.columns:
-                continue  # skip untouched columns
+        row_targets.append((row_idx, row))
 
-            value = row.get(col_name, "")
-            cell = f"'{sheet.title}'!{gspread.utils.rowcol_to_a1(row_idx, col_idx)}"
+    # Merge consecutive sheet rows into blocks; each block is written as one rectangular range per column run
+    row_blocks = []
+    for row_idx, row in sorted(row_targets, key=lambda target: target[0]):
+        if row_blocks and row_blocks[-1][-1][0] == row_idx - 1:
+            row_blocks[-1].append((row_idx, row))
+        else:
+            row_blocks.append([(row_idx, row)])
 
+    batch_body = []
+    for block in row_blocks:
+        first_row, last_row = block[0][0], block[-1][0]
+        for start_col, end_col, col_names in run_ranges:
             batch_body.append({
-                "range": cell,
+                "range": f"{start_col}{first_row}:{end_col}{last_row}",
                 "majorDimension": "ROWS",
-                "values": [[value]]  # single cell update
+                "values": [[row.get(col_name, "") for col_name in col_names] for _, row in block]
             })
 
-    sheet.spreadsheet.values_batch_update(
-        body={
-            "value_input_option": "USER_ENTERED",
-            "data": batch_body
+    # The worksheet-level call prefixes each range with the (properly quoted) sheet title
+    sheet.batch_update(batch_body, value_input_option=gspread.utils.ValueInputOption.user_entered)
+
+    # Build every column's rule in one pass over the header
+    desired_rules = {}
+    for col_index, col_name in enumerate(header):
+        color = FORMAT_COLUMN_COLORS.get(col_name)
+        if color is None:
+            continue  # column doesn't need formatting
+
+        # The range is left open below the header (no endRowIndex) so it covers rows appended later and
+        # the rule stays identical from run to run as the number of repos changes
+        rule = {
+            "ranges": [{
+                "sheetId": sheet.id,
+                "startRowIndex": HEADER_ROW_INDEX,           # start after header
+                "startColumnIndex": col_index,
+                "endColumnIndex": col_index + 1
+            }],
+            "booleanRule": {
+                "condition": {
+                    "type": "TEXT_EQ",
+                    "values": [{"userEnteredValue": "No"}]
+                },
+                "format": {
+                    "backgroundColor": color
+                }
+            }
         }
+        desired_rules[conditional_format_key(rule)] = rule
+
+    # Reconcile with the sheet's rules: keep one copy of each desired rule, delete our own stale ones (e.g.,
+    # bounded ranges or duplicates from older runs), and add only what's missing. Once the sheet is in
+    # sync, the formatting step costs only the metadata read.
+    requests = []
+    present = set()
+    for index, existing_rule in enumerate(get_conditional_formats(sheet)):
+        key = conditional_format_key(existing_rule)
+        if key in desired_rules and key not in present:
+            present.add(key)
+        elif is_exporter_format_rule(key):
+            requests.append({"deleteConditionalFormatRule": {"sheetId": sheet.id, "index": index}})
+
+    # Delete from the highest index down so earlier deletions don't shift the later ones
+    requests.reverse()
+    requests.extend(
+        {"addConditionalFormatRule": {"rule": rule, "index": 0}}
+        for key, rule in desired_rules.items()
+        if key not in present
     )
 
-    def get_column_index(col_name: str):
-        try:
-            return header.index(col_name)
-        except ValueError:
-            return None  # column not found
-
-    red_columns = {
-        "README",
-        "License",
-        ".gitignore",
-        "Package Requirements",
-        "CITATION"
-    }
+    if requests:
+        sheet.spreadsheet.batch_update({"requests": requests})
 
-    orange_columns = {
-        ".zenodo.json",
-        "CONTRIBUTING",
-        "AGENTS",
-        "Website Reference",
-        "Dataset",
-        "Model",
-        "Paper Association",
-        "DOI for GitHub Repo"
-    }
+def load_existing_sheet(spreadsheet_id: str, sheet_name: str, creds_path: str) -> tuple:
+    """
+    Opens the worksheet and reads it once, returning (sheet, all values, existing_df).
 
-    rules = []
-
-    # Only loop over columns that need formatting
-    for col_set, color in [(red_columns, {"red": 1, "green": 0.5, "blue": 0.5}),
-                        (orange_columns, {"red": 1, "green": 0.8, "blue": 0.4})]:
-
-        for col_name in col_set:
-            col_index = get_column_index(col_name)
-            if col_index is None:
-                continue  # skip missing columns
-
-            rules.append({
-                "addConditionalFormatRule": {
-                    "rule": {
-                        "ranges": [{
-                            "sheetId": sheet.id,
-                            "startRowIndex": HEADER_ROW_INDEX,           # start after header
-                            "endRowIndex": HEADER_ROW_INDEX + len(df),   # only data rows
-                            "startColumnIndex": col_index,
-                            "endColumnIndex": col_index + 1
-                        }],
-                        "booleanRule": {
-                            "condition": {
-                                "type": "TEXT_EQ",
-                                "values": [{"userEnteredValue": "No"}]
-                            },
-                            "format": {
-                                "backgroundColor": color
-                            }
-                        }
-                    },
-                    "index": 0
-                }
-            })
+    existing_df holds the repo name, date created, and created by columns, so get_repo_creator can reuse
+    "Created By" for repos already in the sheet. On failure the sheet and values are None and existing_df
+    is empty.
+    """
+    existing_df = pd.DataFrame()
+    sheet = None
+    all_values = None
+
+    try:
+        sheet = open_worksheet(spreadsheet_id, sheet_name, creds_path)
+        all_values = sheet.get_all_values()
+
+        if len(all_values) > 2:
+            headers = all_values[1]
+            rows = all_values[2:]
+
+            # Only the three columns get_repo_creator reads are kept, instead of framing the whole sheet
+            columns = ["Repository Name", "Date Created", "Created By"]
+            col_indices = [headers.index(col_name) for col_name in columns]
+            existing_df = pd.DataFrame(
+                [[row[i] for i in col_indices] for row in rows],
+                columns=columns,
+            )
+            existing_df["Repository Name"] = extract_display_names(existing_df["Repository Name"])
+
+    except Exception as e:
+        print(f"Warning: Could not load existing sheet data: {e}")
+
+    return sheet, all_values, existing_df
 
-    sheet.spreadsheet.batch_update({"requests": rules})
 # --------
 
 def main():
     parser = argparse.ArgumentParser(description="Export GitHub org repo metadata to Google Sheets.")
     parser.add_argument("--org", default=None, help="GitHub org name (overrides GH_ORG_NAME in .env)")
-    parser.add_argument("--token", default=None, help="GitHub personal access token (overrides GH_TOKEN in .env)")
+    parser.add_argument("--token", default=None, help="GitHub personal access token(s), comma-separated (overrides GH_TOKENS/GH_TOKEN in .env)")
     parser.add_argument("--repo-type", default="all", help="Repo type filter: all, public, private, forks, sources, member; default: all")
     parser.add_argument("--spreadsheet-id", default=None, help="Google Sheets spreadsheet ID (overrides SPREADSHEET_ID in .env)")
     parser.add_argument("--sheet-name", default=None, help=f"Sheet tab name (overrides GH_SHEET_NAME in .env; default: {GH_SHEET_NAME})")
     parser.add_argument("--credentials-path", default=None, help=f"Path to service_account.json (overrides GOOGLE_CREDENTIALS_PATH in .env; default: {GOOGLE_CREDENTIALS_PATH})")
+    parser.add_argument("--cache-path", default=None, help=f"Path to the cache of previously exported rows (overrides GH_CACHE_PATH in .env; default: {GH_CACHE_PATH})")
+    parser.add_argument("--full-sweep", action="store_true", help=f"Refetch every repo instead of reusing cached rows for unchanged repos (done automatically every {FULL_SWEEP_INTERVAL.days} days)")
+    parser.add_argument("--by-commit-count", dest="with_lines_changed", action="store_false", help="Rank top contributors by commit count instead of lines changed (skips the slow statistics endpoint; values are marked \"(commit-based)\")")
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS, help=f"Number of repos to fetch concurrently (default: {MAX_WORKERS})")
     args = parser.parse_args()
 
     org_name = args.org or GH_ORG_NAME
-    TOKEN = (args.token or GH_TOKEN or "").strip() or None 
+    tokens = parse_tokens(args.token or GH_TOKENS or GH_TOKEN)
+    TOKEN = tokens[0] if tokens else None
     repo_type = args.repo_type
     spreadsheet_id = args.spreadsheet_id or SPREADSHEET_ID
     sheet_name = args.sheet_name or GH_SHEET_NAME
     creds_path = args.credentials_path or GOOGLE_CREDENTIALS_PATH
+    cache_path = args.cache_path or GH_CACHE_PATH
+    max_workers = max(1, args.max_workers)
 
     required_vars = {
         "GH_ORG_NAME": org_name,
@@ -564,56 +1041,41 @@ def main():
         
     start_time = time.time()
 
-    gh = Github(auth=Auth.Token(TOKEN)) if TOKEN else Github()
+    # Size the keep-alive pool to the worker count; with the default pool (10), extra threads get
+    # their connections discarded and pay a fresh TLS handshake on the next request.
+    # per_page=100 (the API maximum, default 30) cuts the org repo listing to a third as many pages.
+    # With several tokens, repos are handed to the clients round-robin. Each client's default retry
+    # policy waits out its own token's rate limit reset, so one exhausted token only parks its repos.
+    clients = [
+        Github(auth=Auth.Token(token) if token else None, per_page=100, pool_size=max_workers)
+        for token in tokens or [None]
+    ]
+    # Unauthenticated clients only get 60 requests an hour, which no buffer check would help with
+    if tokens:
+        clients = select_clients(clients)
+    gh = clients[0]
     
-    try:
-        org = gh.get_organization(org_name)
-    except Exception as e:
-        print(f"ERROR: Could not access org: \"{org_name}\"")
-        return
-    
-    print("")
-    print(f"Fetching repositories from organization: {org_name}")
-    print("")
-    print("----------------")
+    # The sheet read doesn't depend on GitHub, so it runs alongside the org lookup and repo listing
+    with ThreadPoolExecutor(max_workers=1) as sheet_loader:
+        sheet_future = sheet_loader.submit(load_existing_sheet, spreadsheet_id, sheet_name, creds_path)
 
-    repos = list(org.get_repos(type=repo_type))
-    print(f"Total repos fetched: {len(repos)}")
-    data = []
-    
-    # Load repo name, date created, and created by columns from existing sheet before fetching repo 
-    # to avoid recomputing "Created By" for repos already in the sheet
-    
-    existing_df = pd.DataFrame()
-
-    try:
-        creds = Credentials.from_service_account_file(
-            creds_path,
-            scopes=[
-               "https://www.googleapis.com/auth/spreadsheets",
-               "https://www.googleapis.com/auth/drive"
-            ]
-        )
-
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(spreadsheet_id).worksheet(sheet_name)
+        try:
+            org = gh.get_organization(org_name)
+        except Exception as e:
+            print(f"ERROR: Could not access org: \"{org_name}\"")
+            return
 
-        all_values = sheet.get_all_values()
+        print("")
+        print(f"Fetching repositories from organization: {org_name}")
+        print("")
+        print("----------------")
 
-        if len(all_values) > 2:
-            headers = all_values[1]
-            rows = all_values[2:]
+        repos = list(org.get_repos(type=repo_type))
+        print(f"Total repos fetched: {len(repos)}")
 
-            full_df = pd.DataFrame(rows, columns=headers)
-            existing_df = full_df[
-                    ["Repository Name", "Date Created", "Created By"]
-            ].copy()
-            existing_df["Repository Name"] = existing_df["Repository Name"].apply(
-                lambda v: extract_display_name(v) if isinstance(v, str) else ""
-            )
+        sheet, all_values, existing_df = sheet_future.result()
 
-    except Exception as e:
-        print(f"Warning: Could not load existing sheet data: {e}")
+    data = []
 
     tqdm_kwargs = {}
     if os.environ.get("CI") == "true":
@@ -621,25 +1083,107 @@ def main():
 
     print(f"Existing sheet data shape: {existing_df.shape}")
     
-    for repo in tqdm(repos, desc=f"Fetching repositories from {org_name}...", unit="repo", colour="green", ncols=100, **tqdm_kwargs):
+    repo_cache = load_repo_cache(cache_path)
+    full_sweep = args.full_sweep or is_full_sweep_due(repo_cache)
+    cached_repos = {} if full_sweep else repo_cache["repos"]
+    new_cache = {}
+    cache_hits = 0
+
+    if full_sweep:
+        print("Running a full sweep: cached rows will not be reused")
+
+    # Cache lookups need no API calls, so they are resolved up front to know which repos need fetching
+    inactive_cutoff = get_inactive_cutoff()
+    cached_infos = {
+        repo.full_name: get_cached_repo_info(repo, cached_repos, inactive_cutoff, args.with_lines_changed)
+        for repo in repos
+    }
+    uncached_names = [repo.name for repo in repos if cached_infos[repo.full_name] is None]
+    prefetched = {}
+
+    def checkpoint_cache():
+        # Keeps the previous entries for repos not reached yet and leaves last_full_sweep alone, so a run that
+        # crashes partway only refetches what it hadn't finished (a crashed full sweep still starts over)
         try:
-            info = get_repo_info(repo, existing_df)
-            data.append(info)
-            tqdm.write(f"Fetched info for /{repo.name} repo")
-        except Exception as e:
-            tqdm.write(f"ERROR: Cannot fetch /{repo.name} info, due to {type(e).__name__}: {e}. Skipping...")
+            save_repo_cache(
+                cache_path,
+                {"last_full_sweep": repo_cache["last_full_sweep"], "repos": {**repo_cache["repos"], **new_cache}},
+            )
+        except OSError as e:
+            tqdm.write(f"Warning: Could not checkpoint repo cache to {cache_path}: {e}")
+
+    # GraphQL requires authentication, so unauthenticated runs use the per-check REST calls
+    def fetch_info(repo):
+        # Returns the row, whether it came from the cache, and whether it can be cached (no fetch errors)
+        cached = cached_infos[repo.full_name]
+        if cached is not None:
+            return cached, True, True
+
+        # Repos missing from the batched results get their own query before falling back to REST
+        metadata = prefetched.get(repo.name) or (fetch_repo_metadata(repo) if TOKEN else None)
+        errors = []
+        info = get_repo_info(repo, existing_df, metadata, args.with_lines_changed, inactive_cutoff, errors)
+        return info, False, not errors
+
+    # Fetch repos concurrently; results are collected here in the main thread, so `data` needs no lock
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if TOKEN and uncached_names:
+            batches = [
+                uncached_names[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(uncached_names), GRAPHQL_BATCH_SIZE)
+            ]
+            batch_futures = [
+                executor.submit(fetch_repos_metadata, clients[i % len(clients)].requester, org.login, batch)
+                for i, batch in enumerate(batches)
+            ]
+            for future in batch_futures:
+                prefetched.update(future.result())
+            print(f"Fetched metadata for {len(prefetched)} repositories in {len(batches)} GraphQL requests")
+
+        futures = {
+            executor.submit(fetch_info, bind_repo(repo, clients[i % len(clients)]) if len(clients) > 1 else repo): repo
+            for i, repo in enumerate(repos)
+        }
+
+        for future in tqdm(as_completed(futures), total=len(futures), desc=f"Fetching repositories from {org_name}...", unit="repo", colour="green", ncols=100, **tqdm_kwargs):
+            repo = futures[future]
+            try:
+                info, from_cache, complete = future.result()
+                data.append(info)
+                # A row with fetch errors keeps the previous entry, so a transient failure isn't pinned in
+                # the cache until the repo is pushed to or the next full sweep
+                if complete:
+                    new_cache[repo.full_name] = {"fingerprint": get_repo_fingerprint(repo, args.with_lines_changed), "row": info}
+                elif repo.full_name in repo_cache["repos"]:
+                    new_cache[repo.full_name] = repo_cache["repos"][repo.full_name]
+
+                if from_cache:
+                    cache_hits += 1
+                    tqdm.write(f"Reused cached info for unchanged /{repo.name} repo")
+                else:
+                    tqdm.write(f"Fetched info for /{repo.name} repo")
+                    if (len(data) - cache_hits) % CACHE_CHECKPOINT_EVERY == 0:
+                        checkpoint_cache()
+            except Exception as e:
+                tqdm.write(f"ERROR: Cannot fetch /{repo.name} info, due to {type(e).__name__}: {e}. Skipping...")
 
     if not data:
         print("ERROR: No data collected")
         return
     
     print("----------------")
+    print(f"Reused cached info for {cache_hits} unchanged repositories")
     print("")
 
+    try:
+        last_full_sweep = datetime.now(timezone.utc).isoformat() if full_sweep else repo_cache["last_full_sweep"]
+        save_repo_cache(cache_path, {"last_full_sweep": last_full_sweep, "repos": new_cache})
+    except OSError as e:
+        print(f"Warning: Could not save repo cache to {cache_path}: {e}")
+
+    data.sort(key=lambda info: info["Repository Name"])
     df = pd.DataFrame(data)
-    df.sort_values(by="Repository Name", inplace=True)
 
-    update_google_sheet(df, spreadsheet_id, sheet_name, creds_path)
+    update_google_sheet(df, spreadsheet_id, sheet_name, creds_path, sheet, all_values)
     print(f"Finished fetching info for {len(df)} repositories from {org_name} organization")
 
     elapsed = time.time() - start_time
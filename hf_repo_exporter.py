@@ -1,15 +1,18 @@
-from huggingface_hub import HfApi, hf_hub_download
+from huggingface_hub import HfApi, hf_hub_url
+from huggingface_hub.utils import EntryNotFoundError, build_hf_headers, hf_raise_for_status, http_backoff
 import pandas as pd
 from tqdm import tqdm
 from google.oauth2.service_account import Credentials
 import gspread
 
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import os
 import re
 from collections import Counter
 import argparse
+import json
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -21,6 +24,41 @@ HF_SHEET_NAME = os.getenv("HF_SHEET_NAME","HF-Repos")
 HF_TOKEN = os.getenv("HF_TOKEN")
 GOOGLE_CREDENTIALS_PATH = os.getenv("GOOGLE_CREDENTIALS_PATH", "service_account.json")
 
+# Where the history and README columns from the previous run are cached between runs
+HF_CACHE_PATH = os.getenv("HF_CACHE_PATH", os.path.join(".cache", "hf_repo_cache.json"))
+
+# Every repo is refetched without the cache this often, so a transient failure doesn't stay cached
+FULL_SWEEP_INTERVAL = timedelta(days=28)
+
+# Repos not modified within this long are flagged as inactive
+INACTIVE_AFTER = timedelta(days=365)
+
+# Columns read from the commit history and the README; both only change with a commit, which moves lastModified
+CACHED_COLUMNS = ("Created By", "Top 4 Contributors/Curators", "Homepage", "Repo", "Paper")
+
+# Repo properties get_repo_info reads, requested in the org listings so no per-repo *_info call is needed
+LISTING_EXPAND = ["createdAt", "lastModified", "likes", "private", "tags", "cardData"]
+
+# Number of repos fetched concurrently; the work is network-bound, so threads overlap API round trips
+MAX_WORKERS = 12
+
+# Columns whose "No" values are highlighted, and the highlight colors
+RED_COLUMNS = {"README", "License", "Repo", "Paper"}
+YELLOW_COLUMNS = {"Associated Datasets", "Associated Models", "Associated Spaces", "DOI"}
+RED = {"red": 1, "green": 0.5, "blue": 0.5}
+YELLOW = {"red": 1, "green": 0.8, "blue": 0.4}
+# Colors as the Sheets API returns them (floats, rounded here), to recognize the rules this script created
+FORMAT_COLORS = {tuple(round(color[c], 2) for c in ("red", "green", "blue")) for color in (RED, YELLOW)}
+
+# Regex patterns, compiled once at import instead of on every call
+LINK_LABELS = ("Homepage", "Repository", "Paper")
+# 'Label: ...' anywhere in the text for all of LINK_LABELS in one alternation, so get_history_fields
+# scans the README once
+LINK_LABELS_RE = re.compile(rf"\b({'|'.join(LINK_LABELS)})\b:\s*([^\r\n]+)", re.IGNORECASE)
+MARKDOWN_JUNK_RE = re.compile(r'[*_`\[\]]')
+URL_RE = re.compile(r'(https?://[^\s)]+)')
+DISPLAY_NAME_RE = re.compile(r'"([^"]+)"\)$')  # repo-name from =HYPERLINK(..., "repo-name")
+
 # Helper Functions
 def get_repo_url(repo, repo_type: str) -> str:
     if repo_type == "dataset":
@@ -30,10 +68,11 @@ def get_repo_url(repo, repo_type: str) -> str:
     else: # model
         return f"https://huggingface.co/{repo.id}"
 
-def get_author(api, repo_id, repo_type, org_name: str | None = None) -> str:
+def get_author(api, repo_id, repo_type, org_name: str | None = None, commits: list | None = None) -> str:
     try:
-        # Fetch all commits
-        commits = api.list_repo_commits(repo_id=repo_id, repo_type=repo_type)
+        # Fetch all commits, unless get_repo_info already did
+        if commits is None:
+            commits = api.list_repo_commits(repo_id=repo_id, repo_type=repo_type)
         if not commits:
             return org_name or "N/A"
 
@@ -54,31 +93,36 @@ def get_author(api, repo_id, repo_type, org_name: str | None = None) -> str:
     except Exception:
         return org_name or "N/A"
 
-def get_top_contributors(api, repo_id, repo_type, org_name: str | None = None) -> str:
+def iter_author_handles(commit):
+    for author in getattr(commit, 'authors', []):
+        # If author is a string (as shown in your logs), use it.
+        # If it's an object, try to get .user or .name
+        if isinstance(author, str):
+            yield author
+        else:
+            handle = getattr(author, 'user', getattr(author, 'name', None))
+            if handle:
+                yield str(handle)
+
+def get_top_contributors(api, repo_id, repo_type, org_name: str | None = None, commits: list | None = None) -> str:
     try:
-        commits = api.list_repo_commits(repo_id=repo_id, repo_type=repo_type)
+        if commits is None:
+            commits = api.list_repo_commits(repo_id=repo_id, repo_type=repo_type)
         
-        all_handles = []
-        for c in commits:
-            authors = getattr(c, 'authors', [])
-            for author in authors:
-                # If author is a string (as shown in your logs), use it.
-                # If it's an object, try to get .user or .name
-                if isinstance(author, str):
-                    all_handles.append(author)
-                else:
-                    handle = getattr(author, 'user', getattr(author, 'name', None))
-                    if handle:
-                        all_handles.append(str(handle))
-            
         # Filter out the Org name and the web-flow bot
         bots_and_orgs = {(org_name or "").lower(), "web-flow"}
-        filtered = [n for n in all_handles if str(n).lower() not in bots_and_orgs]
 
-        if not filtered:
+        # Count straight from the commits instead of collecting every handle into lists first
+        counts = Counter(
+            handle
+            for c in commits
+            for handle in iter_author_handles(c)
+            if handle.lower() not in bots_and_orgs
+        )
+
+        if not counts:
             return org_name or "N/A"
 
-        counts = Counter(filtered)
         # Get top 4 most common contributors
         top_4 = [name for name, count in counts.most_common(4)]
         return ", ".join(top_4)
@@ -100,41 +144,19 @@ def get_open_pr_count(api, repo_id, repo_type) -> int:
         return 0
 
 def get_license(repo) -> str:
-    # 1. cardData
-    try:
-        license_from_card = getattr(repo, "cardData", {}).get("license")
-        if license_from_card:
-            return license_from_card
-    except Exception:
-        pass
-
-    # 2. repo.license attribute
-    try:
-        license_attr = getattr(repo, "license", None)
-        if license_attr:
-            return license_attr
-    except Exception:
-        pass
-
-    # 3. YAML content in README
-    try:
-        readme_text = getattr(repo, "readme", None)
-        if readme_text:
-            import re, yaml
-            match = re.search(r'^---\s*(.*?)\s*---', readme_text, re.DOTALL | re.MULTILINE)
-            if match:
-                yaml_content = match.group(1)
-                data = yaml.safe_load(yaml_content)
-                if isinstance(data, dict):
-                    return data.get("license", "No")
-    except Exception:
-        pass
+    # cardData (the README's parsed YAML front matter) first, then the repo's license attribute
+    card = getattr(repo, "cardData", None) or {}
+    license_from_card = card.get("license") if hasattr(card, "get") else None
+    return license_from_card or getattr(repo, "license", None) or "No"
 
-    return "No"
+def get_inactive_cutoff() -> datetime:
+    return datetime.now(timezone.utc) - INACTIVE_AFTER
 
-def is_inactive(repo) -> str:
+def is_inactive(repo, cutoff: datetime | None = None, last_modified: datetime | None = None) -> str:
+    # main() computes the cutoff once per run, so every repo is judged against the same instant;
+    # get_repo_info() passes the lastModified it already read
     try:
-        last_modified = getattr(repo, "lastModified", None)
+        last_modified = last_modified or getattr(repo, "lastModified", None)
         if not last_modified:
             return "N/A"
 
@@ -142,8 +164,7 @@ def is_inactive(repo) -> str:
         if last_modified.tzinfo is None:
             last_modified = last_modified.replace(tzinfo=timezone.utc)
 
-        one_year_ago = datetime.now(timezone.utc) - timedelta(days=365)
-        return "Yes" if last_modified < one_year_ago else "No"
+        return "Yes" if last_modified < (cutoff or get_inactive_cutoff()) else "No"
     except Exception:
         return "N/A"
 
@@ -167,11 +188,22 @@ def get_associated_datasets(repo) -> str:
     except Exception:
         return "No"
 
-def get_associated_models(api, repo, repo_type) -> str:
+def find_ids_containing(repo_id: str, ids: list[str]) -> list[str]:
+    # Same matching as the Hub's `search=` on repo ids (a case-insensitive substring), minus the repo itself
+    needle = repo_id.casefold()
+    return [other for other in ids if needle in other.casefold() and other != repo_id]
+
+def get_associated_models(api, repo, repo_type, org_model_ids: list[str] | None = None) -> str:
     found = []
     repo_id = getattr(repo, 'id', str(repo))
 
     if repo_type == "dataset":
+        if org_model_ids is not None:
+            # Matches the org's own model ids only. The Hub search also returned other owners' ids that contain
+            # "<org>/<dataset>" (e.g. "Not<org>/<dataset>-v2"); those are deliberately left out
+            found = find_ids_containing(repo_id, org_model_ids)
+            return ", ".join(found) if found else "No"
+
         tqdm.write(f"--- Searching Models for Dataset: {repo_id} ---")
         try:
             # Again, using 'search' to find any model mentioning this dataset
@@ -184,7 +216,7 @@ def get_associated_models(api, repo, repo_type) -> str:
 
     return ", ".join(found) if found else "No"
 
-def get_associated_spaces(api, repo_id) -> str:
+def get_associated_spaces(api, repo_id, org_space_ids: list[str] | None = None) -> str:
     found = set()
     
     # Ensure we are using the clean string ID
@@ -199,10 +231,15 @@ def get_associated_spaces(api, repo_id) -> str:
             found.add(s.id)
             
         # 2. String-based Search (The "Catch-all")
-        # This finds spaces that mention it but didn't use the standard YAML format
-        spaces_by_search = list(api.list_spaces(search=clean_id))
-        for s in spaces_by_search:
-            found.add(s.id)
+        # This finds spaces that mention it but didn't use the standard YAML format.
+        # When main() passes the org's space ids, only those are matched: other owners' ids containing the
+        # repo id (e.g. "Not<org>/<name>-demo") are left out, unlike the Hub search
+        if org_space_ids is not None:
+            found.update(find_ids_containing(clean_id, org_space_ids))
+        else:
+            spaces_by_search = list(api.list_spaces(search=clean_id))
+            for s in spaces_by_search:
+                found.add(s.id)
 
         # 3. Handle specific Org-level associations
         # Sometimes spaces are linked but not indexed under the ID
@@ -243,53 +280,190 @@ def get_doi(repo) -> str:
 
     return "No"
 
-def extract_link_from_text(text, label):
-    if not text:
-        return "No"
+def extract_links_from_text(text) -> dict[str, str]:
+    """
+    Extracts the 'Label: ...' link for every label in LINK_LABELS, from a single pass over the text.
+
+    Each label keeps its first match (case-insensitive, whole word); labels that aren't found are "No".
+    """
+    found = {}
+    if text:
+        labels = {label.casefold(): label for label in LINK_LABELS}
+        for match in LINK_LABELS_RE.finditer(text):
+            found.setdefault(labels[match.group(1).casefold()], match.group(2))
 
-    # Pattern to find 'Label: ...' anywhere in the text
-    # Added \b to ensure we match the exact word
-    pattern = rf"\b{label}\b:\s*([^\r\n]+)"
-    match = re.search(pattern, text, re.IGNORECASE)
+    return {label: format_link(found[label], label) if label in found else "No" for label in LINK_LABELS}
+
+def format_link(content, label):
+    content = content.strip()
+    # Remove common markdown junk: *, _, `, [, ]
+    content = MARKDOWN_JUNK_RE.sub('', content).strip()
     
-    if match:
-        content = match.group(1).strip()
-        # Remove common markdown junk: *, _, `, [, ]
-        content = re.sub(r'[*_`\[\]]', '', content).strip()
-        
-        # Filter out placeholders
-        if content.upper() in ["N/A", "NONE", "", "NULL", "TBA", "COMING SOON", "IN PROGRESS", "TBD", "-->"]:
-            return "No"
-
-        # If it contains an http link, create a clean HYPERLINK formula
-        if "http" in content.lower():
-            url_match = re.search(r'(https?://[^\s)]+)', content)
-            if url_match:
-                url = url_match.group(1).rstrip('.,)]')
-                # Use the text before the '(' as the label, or the default label
-                display_text = content.split('(')[0].strip() or label
-                # Double up quotes for Google Sheets formula safety
-                display_text = display_text.replace('"', '""')
-                return f'=HYPERLINK("{url}", "{display_text}")'
-        
-        return content
-    return "No"
+    # Filter out placeholders
+    if content.upper() in ["N/A", "NONE", "", "NULL", "TBA", "COMING SOON", "IN PROGRESS", "TBD", "-->"]:
+        return "No"
 
-def get_repo_info(api, repo, repo_type: str, token: str | None = None, org_name: str | None = None) -> dict[str, str | int]:
-    # 1. Download README once
+    # If it contains an http link, create a clean HYPERLINK formula
+    if "http" in content.lower():
+        url_match = URL_RE.search(content)
+        if url_match:
+            url = url_match.group(1).rstrip('.,)]')
+            # Use the text before the '(' as the label, or the default label
+            display_text = content.split('(')[0].strip() or label
+            # Double up quotes for Google Sheets formula safety
+            display_text = display_text.replace('"', '""')
+            return f'=HYPERLINK("{url}", "{display_text}")'
+    
+    return content
+
+def download_readme(repo_id: str, repo_type: str, token: str | None = None) -> str:
+    # Read straight into memory: hf_hub_download would write the file into the local Hub cache (with its lock
+    # files and symlinks) only for it to be read back once. http_backoff uses huggingface_hub's shared session
+    # and retries 429s and 5xx with exponential backoff, so concurrent workers back off when rate limited.
+    response = http_backoff(
+        "GET",
+        hf_hub_url(repo_id, "README.md", repo_type=repo_type),
+        headers=build_hf_headers(token=token),
+        follow_redirects=True,
+        timeout=10,
+    )
+    hf_raise_for_status(response)
+    return response.text
+
+def get_history_fields(
+    api, repo, repo_type: str, token: str | None = None, org_name: str | None = None
+) -> tuple[dict[str, str], bool]:
+    """
+    Collects the CACHED_COLUMNS for a repo: the creator and top contributors from its commit history,
+    and the Homepage/Repo/Paper links from its README. Also returns whether both fetches succeeded;
+    fallback values from a failed fetch can be transient, so they shouldn't be cached.
+    """
+    complete = True
+
+    # 1. Download README once; a repo without one is complete with an empty README
     readme_text = ""
     try:
-        path = hf_hub_download(
-            repo_id=repo.id, 
-            filename="README.md", 
-            repo_type=repo_type,
-            token=token
-        )
-        with open(path, 'r', encoding='utf-8') as f:
-            readme_text = f.read()
-        
+        readme_text = download_readme(repo.id, repo_type, token)
+    except EntryNotFoundError:
+        pass
     except Exception as e:
         tqdm.write(f"!!! Failed to download README for {repo.id}: {e}")
+        complete = False
+
+    # 2. Fetch the commit history once for both the creator and the top contributors
+    try:
+        commits = api.list_repo_commits(repo_id=repo.id, repo_type=repo_type)
+    except Exception:
+        commits = []
+        complete = False
+
+    links = extract_links_from_text(readme_text)
+    fields = {
+        "Created By": get_author(api, repo.id, repo_type, org_name, commits),
+        "Top 4 Contributors/Curators": get_top_contributors(api, repo.id, repo_type, org_name, commits),
+        "Homepage": links["Homepage"],
+        "Repo": links["Repository"],
+        "Paper": links["Paper"],
+    }
+    return fields, complete
+
+def get_repo_cache_key(repo, repo_type: str) -> str:
+    # Models, datasets, and spaces can share an id, so the type is part of the key
+    return f"{repo_type}/{repo.id}"
+
+def get_repo_fingerprint(repo) -> str | None:
+    last_modified = getattr(repo, "lastModified", None)
+    return last_modified.isoformat() if last_modified else None
+
+def load_repo_cache(path: str) -> dict:
+    """
+    Loads the cache saved by the previous run: `repos` maps get_repo_cache_key() to the repo's fingerprint
+    and CACHED_COLUMNS, and `last_full_sweep` is when every repo was last fetched without using the cache.
+
+    Returns an empty cache if the file is missing or unreadable.
+    """
+    empty = {"last_full_sweep": None, "repos": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty
+
+    if not isinstance(cache, dict) or not isinstance(cache.get("repos"), dict):
+        return empty
+    return {"last_full_sweep": cache.get("last_full_sweep"), "repos": cache["repos"]}
+
+def is_full_sweep_due(cache: dict, now: datetime | None = None) -> bool:
+    last_full_sweep = cache.get("last_full_sweep")
+    if not last_full_sweep:
+        return True
+
+    try:
+        last_full_sweep = datetime.fromisoformat(last_full_sweep)
+    except (TypeError, ValueError):
+        return True
+
+    now = now or datetime.now(timezone.utc)
+    return now - last_full_sweep >= FULL_SWEEP_INTERVAL
+
+def save_repo_cache(path: str, cache: dict) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temp file first so an interrupted run can't leave a truncated cache behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+def get_cached_history_fields(repo, repo_type: str, cache: dict[str, dict]) -> dict[str, str] | None:
+    # Returns None if the repo has no cache entry or has been modified since it was cached
+    entry = cache.get(get_repo_cache_key(repo, repo_type))
+    fingerprint = get_repo_fingerprint(repo)
+    if not entry or fingerprint is None or entry.get("fingerprint") != fingerprint:
+        return None
+    return entry["fields"]
+
+def update_repo_cache(
+    new_cache: dict[str, dict],
+    previous_cache: dict[str, dict],
+    repo,
+    repo_type: str,
+    info: dict[str, str | int],
+    complete: bool = True,
+) -> None:
+    # A row whose README or commits fetch failed keeps the previous entry, so a transient
+    # failure isn't pinned in the cache until the repo is modified or the next full sweep
+    key = get_repo_cache_key(repo, repo_type)
+    fingerprint = get_repo_fingerprint(repo)
+    if complete and fingerprint is not None:
+        new_cache[key] = {
+            "fingerprint": fingerprint,
+            "fields": {column: info[column] for column in CACHED_COLUMNS},
+        }
+    elif key in previous_cache:
+        new_cache[key] = previous_cache[key]
+
+def get_repo_info(
+    api,
+    repo,
+    repo_type: str,
+    token: str | None = None,
+    org_name: str | None = None,
+    history: dict[str, str] | None = None,
+    org_repo_ids: dict[str, list[str]] | None = None,
+    cutoff: datetime | None = None,
+) -> dict[str, str | int]:
+    # `history` is a cached get_history_fields() result; without it the README and commits are fetched.
+    # `org_repo_ids` maps "model"/"space" to the org's listed ids, matched instead of a Hub search per repo
+    # (so only the org's own repos are matched by id; other owners' spaces that declare a model in their
+    # metadata are still found).
+    # `cutoff` is the inactivity cutoff from get_inactive_cutoff(), computed on each call if omitted
+    org_repo_ids = org_repo_ids or {}
+    last_modified = getattr(repo, "lastModified", None)
+    if history is None:
+        history, _ = get_history_fields(api, repo, repo_type, token, org_name)
 
     if repo_type == "dataset":
         display_id = f"datasets/{repo.id}"
@@ -303,21 +477,21 @@ def get_repo_info(api, repo, repo_type: str, token: str | None = None, org_name:
         "Repository Type": repo_type,
         "Description": get_card_field(repo, ["model_description", "description"]) or "N/A",
         "Date Created": repo.created_at.strftime("%Y-%m-%d") if getattr(repo, "created_at", False) else "N/A",
-        "Last Updated": repo.lastModified.strftime("%Y-%m-%d") if getattr(repo, "lastModified", False) else "N/A",
-        "Created By": get_author(api, repo.id, repo_type, org_name),
-        "Top 4 Contributors/Curators": get_top_contributors(api, repo.id, repo_type, org_name),
+        "Last Updated": last_modified.strftime("%Y-%m-%d") if last_modified else "N/A",
+        "Created By": history["Created By"],
+        "Top 4 Contributors/Curators": history["Top 4 Contributors/Curators"],
         "Likes": getattr(repo, "likes", "N/A"),
         "# of Open PRs": get_open_pr_count(api, repo.id, repo_type),
         "README": "Yes" if getattr(repo, "cardData", False) else "No",
         "License": get_license(repo),
         "Visibility": "Private" if getattr(repo, "private", False) else "Public",
-        "Inactive": is_inactive(repo),
-        "Homepage": extract_link_from_text(readme_text, "Homepage"), 
-        "Repo": extract_link_from_text(readme_text, "Repository"),
-        "Paper": extract_link_from_text(readme_text, "Paper"),
+        "Inactive": is_inactive(repo, cutoff, last_modified),
+        "Homepage": history["Homepage"],
+        "Repo": history["Repo"],
+        "Paper": history["Paper"],
         "Associated Datasets": get_associated_datasets(repo),
-        "Associated Models": get_associated_models(api, repo, repo_type),
-        "Associated Spaces": get_associated_spaces(api, repo),
+        "Associated Models": get_associated_models(api, repo, repo_type, org_repo_ids.get("model")),
+        "Associated Spaces": get_associated_spaces(api, repo, org_repo_ids.get("space")),
         "DOI": get_doi(repo), 
     }
 
@@ -331,9 +505,44 @@ def ensure_string_value(value) -> str:
         return str(value)
     return str(value)
 
-def extract_display_name(val: str) -> str:
-    match = re.search(r'"([^"]+)"\)$', val) # regex to extract the repo-name from "=HYPERLINK(..., "repo-name")"
-    return match.group(1) if match else val
+def get_sort_key(info: dict) -> str:
+    # Rows sort by the repo-name shown in the sheet, case-insensitively, not by the formula's URL
+    name = info["Repository Name"]
+    match = DISPLAY_NAME_RE.search(name)
+    return (match.group(1) if match else name).casefold()
+
+def extract_display_names(values: pd.Series) -> pd.Series:
+    # Extracts repo-name from "=HYPERLINK(..., "repo-name")" for a whole column in one pandas pass
+    # (instead of a Python-level regex call per value); values that aren't formulas are kept as-is
+    values = values.fillna("").astype(str)
+    return values.str.extract(DISPLAY_NAME_RE, expand=False).fillna(values)
+
+def get_conditional_formats(sheet) -> list[dict]:
+    metadata = sheet.spreadsheet.fetch_sheet_metadata(
+        params={"fields": "sheets(properties(sheetId),conditionalFormats(ranges,booleanRule))"}
+    )
+    for sheet_metadata in metadata.get("sheets", []):
+        if sheet_metadata.get("properties", {}).get("sheetId") == sheet.id:
+            return sheet_metadata.get("conditionalFormats", [])
+    return []
+
+def conditional_format_key(rule: dict) -> tuple:
+    # Identifies a rule by its ranges, condition, and color; colors are rounded because the API returns
+    # them as floats and omits zero components
+    boolean_rule = rule.get("booleanRule", {})
+    condition = boolean_rule.get("condition", {})
+    color = boolean_rule.get("format", {}).get("backgroundColor", {})
+    ranges = tuple(sorted(
+        (rng.get("startRowIndex"), rng.get("endRowIndex"), rng.get("startColumnIndex"), rng.get("endColumnIndex"))
+        for rng in rule.get("ranges", [])
+    ))
+    values = tuple(value.get("userEnteredValue") for value in condition.get("values", []))
+    return ranges, condition.get("type"), values, tuple(round(color.get(c, 0), 2) for c in ("red", "green", "blue"))
+
+def is_exporter_format_rule(key: tuple) -> bool:
+    # True for a "No" highlight in one of the exporter's colors, i.e., a rule this script created
+    _, condition_type, values, color = key
+    return condition_type == "TEXT_EQ" and values == ("No",) and color in FORMAT_COLORS
 
 def update_google_sheet(df: pd.DataFrame, spreadsheet_id: str, sheet_name: str, creds_path: str) -> None:
     # Authenticate Google API
@@ -346,119 +555,161 @@ def update_google_sheet(df: pd.DataFrame, spreadsheet_id: str, sheet_name: str,
         ]
     )
 
-    client = gspread.authorize(creds)
+    # Retries Sheets requests that hit the per-minute quota (429) or a 5xx with exponential backoff,
+    # instead of failing the whole export after every repo has been fetched
+    client = gspread.authorize(creds, http_client=gspread.BackOffHTTPClient)
     sheet = client.open_by_key(spreadsheet_id).worksheet(sheet_name)
 
+    # The header and the repo names come from one read of the sheet instead of a separate header request
+    existing = sheet.get_all_values()
+
     # Pull current header
     HEADER_ROW_INDEX = 2
-    header = sheet.row_values(HEADER_ROW_INDEX)
+    header = existing[HEADER_ROW_INDEX - 1] if len(existing) >= HEADER_ROW_INDEX else []
+
+    # Column name -> 0-based index, built once instead of scanning the header per lookup
+    # (setdefault keeps the first occurrence, as header.index() would)
+    header_index = {}
+    for col_index, col_name in enumerate(header):
+        header_index.setdefault(col_name, col_index)
 
     # Find 
-    try: 
-        repo_col_index = header.index("Repository Name")
-    except ValueError:
+    repo_col_index = header_index.get("Repository Name")
+    if repo_col_index is None:
         raise ValueError('Sheet is missing "Repository Name" column')
 
     # Build a dict of repo name -> index
-    existing = sheet.get_all_values()
     data_rows = existing[HEADER_ROW_INDEX:]
-    name_to_row = {}
+    row_numbers = []
+    sheet_names = []
     for offset, row in enumerate(data_rows, start=HEADER_ROW_INDEX + 1):
         if len(row) <= repo_col_index: # if row of data fetched is missing repo name column, ignore the row
             continue
 
-        sheet_repo_name = extract_display_name(row[repo_col_index]) # hardcoded to check for "Repository Name" column in row 0
-        name_to_row[sheet_repo_name] = offset
+        row_numbers.append(offset)
+        sheet_names.append(row[repo_col_index])
 
-    batch_body = []
-    for _, row in df.iterrows():
-        repo_name = extract_display_name(row["Repository Name"])
+    name_to_row = dict(zip(extract_display_names(pd.Series(sheet_names, dtype=object)), row_numbers))
+
+    # Group the header into runs of adjacent columns present in df, so each row is written as one range
+    # per run instead of one range per cell; columns not in df (e.g., manual notes) are left untouched
+    df_columns = set(df.columns)
+    column_runs = []
+    for col_idx, col_name in enumerate(header, start=1):
+        if col_name not in df_columns:
+            continue
+
+        if column_runs and column_runs[-1][-1][0] == col_idx - 1:
+            column_runs[-1].append((col_idx, col_name))
+        else:
+            column_runs.append([(col_idx, col_name)])
+
+    # Resolve each run's column letters once; only the row number changes per range
+    run_ranges = [
+        (
+            gspread.utils.rowcol_to_a1(1, run[0][0])[:-1],
+            gspread.utils.rowcol_to_a1(1, run[-1][0])[:-1],
+            [col_name for _, col_name in run],
+        )
+        for run in column_runs
+    ]
+
+    # New repos go after the last existing row
+    next_row_idx = len(existing) + 1
+
+    # Resolve each repo's target row first, so rows that land next to each other can share a range
+    row_targets = []
+    display_names = extract_display_names(df["Repository Name"])
+    # Cell values are converted to strings in one pass over the frame, then read back as plain tuples per row
+    # (iterrows() would build a pandas Series for every row just to read a few cells)
+    df_positions = {col_name: i for i, col_name in enumerate(df.columns)}
+    string_rows = df.astype(object).map(ensure_string_value).itertuples(index=False, name=None)
+    for repo_name, row in zip(display_names, string_rows):
 
         # Determine row index
         if repo_name in name_to_row:
             row_idx = name_to_row[repo_name]
         else:
-            row_idx = len(existing) + 1
-            existing.append([""] * len(header))
+            row_idx = next_row_idx
+            next_row_idx += 1
 
-        # Create (range, value) for each column individually
-        for col_idx, col_name in enumerate(header, start=1):
-            if col_name not in df.columns:
-                continue  # skip untouched columns
+        row_targets.append((row_idx, row))
 
-            value = row.get(col_name, "")
-            value = ensure_string_value(value)
-            cell = f"'{sheet.title}'!{gspread.utils.rowcol_to_a1(row_idx, col_idx)}"
+    # Merge consecutive sheet rows into blocks; each block is written as one rectangular range per column run
+    row_blocks = []
+    for row_idx, row in sorted(row_targets, key=lambda target: target[0]):
+        if row_blocks and row_blocks[-1][-1][0] == row_idx - 1:
+            row_blocks[-1].append((row_idx, row))
+        else:
+            row_blocks.append([(row_idx, row)])
 
+    batch_body = []
+    for block in row_blocks:
+        first_row, last_row = block[0][0], block[-1][0]
+        for start_col, end_col, col_names in run_ranges:
             batch_body.append({
-                "range": cell,
+                "range": f"{start_col}{first_row}:{end_col}{last_row}",
                 "majorDimension": "ROWS",
-                "values": [[value]]  # single cell update
+                "values": [
+                    [row[df_positions[col_name]] for col_name in col_names]
+                    for _, row in block
+                ]
             })
 
-    sheet.spreadsheet.values_batch_update(
-        body={
-            "value_input_option": "USER_ENTERED",
-            "data": batch_body
+    # The worksheet-level call prefixes each range with the (properly quoted) sheet title
+    sheet.batch_update(batch_body, value_input_option=gspread.utils.ValueInputOption.user_entered)
+
+    # One rule per color covering all of that color's columns. The ranges are left open below the header
+    # (no endRowIndex) so they cover rows appended later and the rules stay identical from run to run
+    desired_rules = {}
+    for col_set, color in [(RED_COLUMNS, RED), (YELLOW_COLUMNS, YELLOW)]:
+        col_indices = sorted(header_index[col_name] for col_name in col_set if col_name in header_index)
+        if not col_indices:
+            continue  # none of this color's columns are in the sheet
+
+        rule = {
+            "ranges": [
+                {
+                    "sheetId": sheet.id,
+                    "startRowIndex": HEADER_ROW_INDEX,           # start after header
+                    "startColumnIndex": col_index,
+                    "endColumnIndex": col_index + 1
+                }
+                for col_index in col_indices
+            ],
+            "booleanRule": {
+                "condition": {
+                    "type": "TEXT_EQ",
+                    "values": [{"userEnteredValue": "No"}]
+                },
+                "format": {
+                    "backgroundColor": color
+                }
+            }
         }
+        desired_rules[conditional_format_key(rule)] = rule
+
+    # Reconcile with the sheet's rules: keep one copy of each desired rule, delete our own stale ones (e.g.,
+    # the per-column bounded rules older runs added every time), and add only what's missing
+    requests = []
+    present = set()
+    for index, existing_rule in enumerate(get_conditional_formats(sheet)):
+        key = conditional_format_key(existing_rule)
+        if key in desired_rules and key not in present:
+            present.add(key)
+        elif is_exporter_format_rule(key):
+            requests.append({"deleteConditionalFormatRule": {"sheetId": sheet.id, "index": index}})
+
+    # Delete from the highest index down so earlier deletions don't shift the later ones
+    requests.reverse()
+    requests.extend(
+        {"addConditionalFormatRule": {"rule": rule, "index": 0}}
+        for key, rule in desired_rules.items()
+        if key not in present
     )
 
-    def get_column_index(col_name: str):
-        try:
-            return header.index(col_name)
-        except ValueError:
-            return None  # column not found
-
-    red_columns = {
-        "README",
-        "License",
-        "Repo",
-        "Paper"
-    }
-
-    yellow_columns = {
-        "Associated Datasets",
-        "Associated Models",
-        "Associated Spaces",
-        "DOI"
-    }
-
-    rules = []
-
-    # Only loop over columns that need formatting
-    for col_set, color in [(red_columns, {"red": 1, "green": 0.5, "blue": 0.5}),
-                        (yellow_columns, {"red": 1, "green": 0.8, "blue": 0.4})]:
-
-        for col_name in col_set:
-            col_index = get_column_index(col_name)
-            if col_index is None:
-                continue  # skip missing columns
-
-            rules.append({
-                "addConditionalFormatRule": {
-                    "rule": {
-                        "ranges": [{
-                            "sheetId": sheet.id,
-                            "startRowIndex": HEADER_ROW_INDEX,           # start after header
-                            "endRowIndex": HEADER_ROW_INDEX + len(df),   # only data rows
-                            "startColumnIndex": col_index,
-                            "endColumnIndex": col_index + 1
-                        }],
-                        "booleanRule": {
-                            "condition": {
-                                "type": "TEXT_EQ",
-                                "values": [{"userEnteredValue": "No"}]
-                            },
-                            "format": {
-                                "backgroundColor": color
-                            }
-                        }
-                    },
-                    "index": 0
-                }
-            })
-
-    sheet.spreadsheet.batch_update({"requests": rules})
+    if requests:
+        sheet.spreadsheet.batch_update({"requests": requests})
 
 # -------
 
@@ -470,6 +721,9 @@ def main():
     parser.add_argument("--spreadsheet-id", default=None, help="Google Sheets spreadsheet ID (overrides SPREADSHEET_ID in .env)")
     parser.add_argument("--sheet-name", default=None, help=f"Sheet tab name (overrides HF_SHEET_NAME in .env; default: {HF_SHEET_NAME})")
     parser.add_argument("--credentials-path", default=None, help=f"Path to service_account.json (overrides GOOGLE_CREDENTIALS_PATH in .env; default: {GOOGLE_CREDENTIALS_PATH})")
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS, help=f"Number of repos to fetch concurrently (default: {MAX_WORKERS})")
+    parser.add_argument("--cache-path", default=None, help=f"Path to the cache of previously fetched history and README columns (overrides HF_CACHE_PATH in .env; default: {HF_CACHE_PATH})")
+    parser.add_argument("--full-sweep", action="store_true", help=f"Refetch every repo instead of reusing cached columns for unmodified repos (done automatically every {FULL_SWEEP_INTERVAL.days} days)")
     args = parser.parse_args()
 
     org_name = args.org or HF_ORG_NAME
@@ -477,6 +731,8 @@ def main():
     spreadsheet_id = args.spreadsheet_id or SPREADSHEET_ID
     sheet_name = args.sheet_name or HF_SHEET_NAME
     creds_path = args.credentials_path or GOOGLE_CREDENTIALS_PATH
+    max_workers = max(1, args.max_workers)
+    cache_path = args.cache_path or HF_CACHE_PATH
   
     required_vars = {
         "HF_ORG_NAME": org_name,
@@ -495,17 +751,16 @@ def main():
 
     api = HfApi(token=TOKEN)
 
+    listings = {"model": api.list_models, "dataset": api.list_datasets, "space": api.list_spaces}
     try:
-        repos = []
-
-        for m in api.list_models(author=org_name, full=True):
-            repos.append((api.model_info(m.id), "model"))
-
-        for d in api.list_datasets(author=org_name, full=True):
-            repos.append((api.dataset_info(d.id), "dataset"))
-
-        for s in api.list_spaces(author=org_name, full=True):
-            repos.append((api.space_info(s.id), "space"))
+        # The three listings are independent, so they are paged through concurrently. Per-repo fetches wait
+        # for all of them, since the associated models/spaces columns match against the full org listing.
+        with ThreadPoolExecutor(max_workers=len(listings)) as listing_pool:
+            listing_futures = {
+                repo_type: listing_pool.submit(lambda list_repos=list_repos: list(list_repos(author=org_name, expand=LISTING_EXPAND)))
+                for repo_type, list_repos in listings.items()
+            }
+            repos = [(repo, repo_type) for repo_type, future in listing_futures.items() for repo in future.result()]
 
     except Exception as e:
         print(f'ERROR: Could not fetch models for "{org_name}"')
@@ -523,23 +778,71 @@ def main():
     if os.environ.get("CI") == "true":
         tqdm_kwargs = {"mininterval": 1, "dynamic_ncols": False, "leave": False}
 
-    for repo, repo_type in tqdm(repos, desc=f"Fetching HF repos from {org_name}...", unit="repo", colour="green", ncols=100, **tqdm_kwargs):
-        try:
-            info = get_repo_info(api, repo, repo_type, token=TOKEN, org_name=org_name)
-            data.append(info)
-            tqdm.write(f"Fetched info for /{repo.id}")
-        except Exception as e:
-            tqdm.write(f"ERROR: Cannot fetch /{repo.id} info, due to {type(e).__name__}: {e}. Skipping...")
+    # The org's model and space ids answer the per-repo id searches for associated models/spaces
+    org_repo_ids = {
+        repo_type: [repo.id for repo, listed_type in repos if listed_type == repo_type]
+        for repo_type in ("model", "space")
+    }
+
+    repo_cache = load_repo_cache(cache_path)
+    full_sweep = args.full_sweep or is_full_sweep_due(repo_cache)
+    cached_repos = {} if full_sweep else repo_cache["repos"]
+    new_cache = {}
+    cache_hits = 0
+
+    if full_sweep:
+        print("Running a full sweep: cached columns will not be reused")
+
+    inactive_cutoff = get_inactive_cutoff()
+
+    def fetch_info(repo, repo_type: str, history: dict[str, str] | None) -> tuple[dict, bool]:
+        # Returns the row and whether its CACHED_COLUMNS can be cached (a cache hit or fully fetched)
+        complete = True
+        if history is None:
+            history, complete = get_history_fields(api, repo, repo_type, TOKEN, org_name)
+        info = get_repo_info(api, repo, repo_type, history=history, org_repo_ids=org_repo_ids, cutoff=inactive_cutoff)
+        return info, complete
+
+    # Fetch repos concurrently; results are collected here in the main thread, so `data` needs no lock
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for repo, repo_type in repos:
+            history = get_cached_history_fields(repo, repo_type, cached_repos)
+            future = executor.submit(fetch_info, repo, repo_type, history)
+            futures[future] = (repo, repo_type, history is not None)
+
+        for future in tqdm(as_completed(futures), total=len(futures), desc=f"Fetching HF repos from {org_name}...", unit="repo", colour="green", ncols=100, **tqdm_kwargs):
+            repo, repo_type, from_cache = futures[future]
+            try:
+                info, complete = future.result()
+                data.append(info)
+                update_repo_cache(new_cache, repo_cache["repos"], repo, repo_type, info, complete)
+
+                if from_cache:
+                    cache_hits += 1
+                    tqdm.write(f"Reused cached history for unmodified /{repo.id}")
+                else:
+                    tqdm.write(f"Fetched info for /{repo.id}")
+            except Exception as e:
+                tqdm.write(f"ERROR: Cannot fetch /{repo.id} info, due to {type(e).__name__}: {e}. Skipping...")
     
     if not data:
         print("ERROR: No data collected")
         return
     
     print("----------------")
+    print(f"Reused cached history for {cache_hits} unmodified repositories")
     print("")
 
+    try:
+        last_full_sweep = datetime.now(timezone.utc).isoformat() if full_sweep else repo_cache["last_full_sweep"]
+        save_repo_cache(cache_path, {"last_full_sweep": last_full_sweep, "repos": new_cache})
+    except OSError as e:
+        print(f"Warning: Could not save repo cache to {cache_path}: {e}")
+
+    # Sort the plain rows before framing them, rather than sorting the DataFrame afterwards
+    data.sort(key=get_sort_key)
     df = pd.DataFrame(data)
-    df.sort_values(by="Repository Name", inplace=True)
 
     update_google_sheet(df, spreadsheet_id, sheet_name, creds_path)
     print(f"Finished fetching info for {len(df)} repositories from {org_name} organization")
@@ -0,0 +1,86 @@
+"""
+In-memory fakes for the gspread worksheet/spreadsheet calls made by both exporters'
+update_google_sheet(), shared by the GitHub and Hugging Face sheet tests.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import gspread
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self.format_requests = []
+        self.conditional_formats = []
+        self.value_ranges = []
+
+    def values_batch_update(self, body):
+        self.value_ranges.extend(entry["range"] for entry in body["data"])
+        for entry in body["data"]:
+            self.worksheet.write_range(entry["range"], entry["values"])
+
+    def batch_update(self, body):
+        self.format_requests.extend(body["requests"])
+        for request in body["requests"]:
+            if "addConditionalFormatRule" in request:
+                add = request["addConditionalFormatRule"]
+                self.conditional_formats.insert(add.get("index", 0), add["rule"])
+            elif "deleteConditionalFormatRule" in request:
+                del self.conditional_formats[request["deleteConditionalFormatRule"]["index"]]
+
+    def fetch_sheet_metadata(self, params=None):
+        return {"sheets": [{
+            "properties": {"sheetId": self.worksheet.id},
+            "conditionalFormats": list(self.conditional_formats),
+        }]}
+
+
+class FakeWorksheet:
+    def __init__(self, rows, title):
+        self.title = title
+        self.id = 0
+        self.rows = [list(row) for row in rows]
+        self.spreadsheet = FakeSpreadsheet(self)
+
+    def row_values(self, row):
+        return list(self.rows[row - 1])
+
+    def get_all_values(self):
+        return [list(row) for row in self.rows]
+
+    def batch_update(self, data, value_input_option=None):
+        data = [{**entry, "range": gspread.utils.absolute_range_name(self.title, entry["range"])} for entry in data]
+        self.spreadsheet.values_batch_update({"valueInputOption": value_input_option, "data": data})
+
+    def write_range(self, a1_range, values):
+        a1_range = a1_range.split("!", 1)[-1]
+        start = a1_range.split(":", 1)[0]
+        start_row, start_col = gspread.utils.a1_to_rowcol(start)
+        for r, row_values in enumerate(values):
+            for c, value in enumerate(row_values):
+                self.set_cell(start_row + r, start_col + c, value)
+
+    def set_cell(self, row, col, value):
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        while len(cells) < col:
+            cells.append("")
+        cells[col - 1] = value
+
+
+@contextmanager
+def open_fake_worksheet(exporter, sheet):
+    """Patches the exporter's Google auth so update_google_sheet() opens `sheet`."""
+    class FakeClient:
+        def open_by_key(self, key):
+            class FakeDoc:
+                def worksheet(self, name):
+                    return sheet
+            return FakeDoc()
+
+    with patch.object(exporter.Credentials, "from_service_account_file"), \
+         patch.object(exporter.gspread, "authorize", return_value=FakeClient()):
+        yield sheet
@@ -70,6 +70,7 @@ def make_mock_repo(
     files=None,
     citation_yaml=None,
     creator=("Jane Doe", "janedoe"),
+    contributors=(("John Smith", "jsmith"), ("Jane Doe", "janedoe")),
 ):
     
     repo = MagicMock()
@@ -89,9 +90,9 @@ def make_mock_repo(
     branches_mock.totalCount = branches
     repo.get_branches.return_value = branches_mock
 
-    repo.get_languages.return_value = (
-        languages if languages is not None else {"Python": 1000, "Shell": 10}
-    )
+    # Primary language as carried in the repo listing: the language with the most bytes
+    languages = languages if languages is not None else {"Python": 1000, "Shell": 10}
+    repo.language = max(languages, key=languages.get) if languages else None
 
     if readme_content is not None:
         repo.get_readme.return_value = FakeContentFile(readme_content)
@@ -111,15 +112,29 @@ def make_mock_repo(
 
     repo.get_contents.side_effect = get_contents
 
+    # Root listing of the default branch, as returned by get_git_tree()
+    root_paths = {path.split("/", 1)[0] for path in files}
+    if citation_yaml is not None:
+        root_paths.add("CITATION.cff")
+    repo.get_git_tree.return_value = MagicMock(tree=[MagicMock(path=path) for path in sorted(root_paths)])
+
     name_, login_ = creator
-    oldest_commit = MagicMock()
-    oldest_commit.author = FakeAuthor(name_, login_)
     commits_mock = MagicMock()
     commits_mock.totalCount = 1
-    commits_mock.get_page.return_value = [oldest_commit]
     repo.get_commits.return_value = commits_mock
     repo._requester = MagicMock(per_page=30)
 
+    # Raw REST calls: the oldest commit (get_repo_creator) and the commit-ranked contributors
+    def request_json(verb, url, parameters=None, **kwargs):
+        if url.endswith("/commits"):
+            return {}, [{"sha": "abc123", "author": {"login": login_, "name": name_}}]
+        if url.endswith("/contributors"):
+            per_page = (parameters or {}).get("per_page", len(contributors))
+            return {}, [{"login": login, "name": name} for name, login in contributors[:per_page]]
+        raise GithubException(404, "Not Found", None)
+
+    repo._requester.requestJsonAndCheck.side_effect = request_json
+
     repo.get_stats_contributors.return_value = [
         FakeContributorStats("Jane Doe", "janedoe", 500, 50),
         FakeContributorStats("John Smith", "jsmith", 200, 20),
@@ -286,4 +301,247 @@ def test_get_repo_info_forked_and_archived_repo():
     assert result["Dataset"] == '=HYPERLINK("https://huggingface.co/datasets/imageomics/cool-data", "Yes")'
     assert result["Model"] == '=HYPERLINK("https://huggingface.co/imageomics/cool-model", "Yes")'
     assert result["Paper Association"] == '=HYPERLINK("https://arxiv.org/abs/1234.5678", "Yes")'
-    assert result["DOI for GitHub Repo"] == "No"
\ No newline at end of file
+    assert result["DOI for GitHub Repo"] == "No"
+
+def make_graphql_response(*, readme=FULL_README, citation=FULL_CITATION, entries=None, license_spdx="MIT"):
+    """Build the payload returned by repo._requester.graphql_query() for REPO_METADATA_QUERY."""
+    if entries is None:
+        entries = ["README.md", "CITATION.cff", ".gitignore", "requirements.txt",
+                   ".zenodo.json", "CONTRIBUTING.md", "AGENTS.md"]
+    return {
+        "data": {
+            "repository": {
+                "licenseInfo": {"spdxId": license_spdx} if license_spdx else None,
+                "primaryLanguage": {"name": "Python"},
+                "refs": {"totalCount": 3},
+                "root": {"entries": [{"name": name} for name in entries]},
+                "readme": {"text": readme} if readme is not None else None,
+                "citation": {"text": citation} if citation is not None else None,
+                "packrat": None,
+            }
+        }
+    }
+
+
+def test_get_repo_info_from_graphql_metadata_matches_rest_output():
+    """The GraphQL path should produce the same row as the REST golden test,
+    without touching any of the per-file REST endpoints."""
+    repo = make_mock_repo(readme_content=FULL_README)
+    repo.full_name = "Imageomics/cool-project"
+    repo._requester.graphql_query.return_value = ({}, make_graphql_response())
+
+    metadata = exporter.fetch_repo_metadata(repo)
+    result = exporter.get_repo_info(repo, existing_df=None, metadata=metadata)
+
+    rest_repo = make_mock_repo(
+        readme_content=FULL_README,
+        files={
+            ".gitignore": "*.pyc",
+            "requirements.txt": "pandas\n",
+            ".zenodo.json": "{}",
+            "CONTRIBUTING.md": "How to contribute",
+            "AGENTS.md": "Agent instructions",
+        },
+        citation_yaml=FULL_CITATION,
+    )
+    assert result == exporter.get_repo_info(rest_repo, existing_df=None)
+
+    repo.get_readme.assert_not_called()
+    repo.get_license.assert_not_called()
+    repo.get_contents.assert_not_called()
+    repo.get_branches.assert_not_called()
+    repo.get_languages.assert_not_called()
+
+
+def test_get_repo_info_from_graphql_metadata_minimal_repo():
+    """Missing blobs/license in the GraphQL payload map to the same 'No' fallbacks."""
+    repo = make_mock_repo(name="bare-repo", readme_content=None, homepage=None)
+    repo.full_name = "Imageomics/bare-repo"
+    repo._requester.graphql_query.return_value = (
+        {}, make_graphql_response(readme=None, citation=None, entries=["main.py"], license_spdx=None)
+    )
+
+    result = exporter.get_repo_info(repo, existing_df=None, metadata=exporter.fetch_repo_metadata(repo))
+
+    assert result["README"] == "No"
+    assert result["License"] == "No"
+    assert result[".gitignore"] == "No"
+    assert result["Package Requirements"] == "No"
+    assert result["CITATION"] == "No"
+    assert result["DOI for GitHub Repo"] == "No"
+    assert result["Dataset"] == "No"
+
+
+def test_fetch_repo_metadata_returns_none_when_graphql_fails():
+    repo = make_mock_repo()
+    repo.full_name = "Imageomics/cool-project"
+    repo._requester.graphql_query.side_effect = GithubException(401, "Requires authentication", None)
+
+    assert exporter.fetch_repo_metadata(repo) is None
+
+
+def test_fetch_repos_metadata_batches_repos_into_one_query():
+    node = make_graphql_response()["data"]["repository"]
+    requester = MagicMock()
+    # r1 is null, as GraphQL returns for a repo the token cannot see
+    requester.graphql_query.return_value = ({}, {"data": {"r0": node, "r1": None, "r2": node}})
+
+    metadata = exporter.fetch_repos_metadata(requester, "Imageomics", ["a-repo", "hidden-repo", "c-repo"])
+
+    requester.graphql_query.assert_called_once()
+    query, variables = requester.graphql_query.call_args.args
+    assert "r2: repository(owner: $owner, name: $n2)" in query
+    assert variables == {"owner": "Imageomics", "n0": "a-repo", "n1": "hidden-repo", "n2": "c-repo"}
+    assert set(metadata) == {"a-repo", "c-repo"}
+    assert metadata["a-repo"]["license"] == "Yes"
+    assert metadata["a-repo"]["branches"] == 3
+
+
+def test_fetch_repos_metadata_keeps_partial_data_from_graphql_errors():
+    node = make_graphql_response()["data"]["repository"]
+    requester = MagicMock()
+    requester.graphql_query.side_effect = GithubException(
+        400, {"data": {"r0": node, "r1": None}, "errors": [{"type": "NOT_FOUND"}, {"type": "FORBIDDEN"}]}, None
+    )
+
+    metadata = exporter.fetch_repos_metadata(requester, "Imageomics", ["a-repo", "hidden-repo"])
+
+    assert set(metadata) == {"a-repo"}
+
+
+def test_fetch_repos_metadata_returns_empty_when_graphql_fails():
+    requester = MagicMock()
+    requester.graphql_query.side_effect = GithubException(502, "Bad Gateway", None)
+
+    assert exporter.fetch_repos_metadata(requester, "Imageomics", ["a-repo"]) == {}
+
+
+def test_get_repo_info_without_lines_changed_uses_contributors_endpoint():
+    """Commit-count ranking should skip the slow statistics endpoint entirely."""
+    repo = make_mock_repo(readme_content=FULL_README)
+
+    result = exporter.get_repo_info(repo, existing_df=None, with_lines_changed=False)
+
+    assert result["Top 4 Contributors (lines of code changes)"] == "John Smith (jsmith), Jane Doe (janedoe) (commit-based)"
+    repo.get_stats_contributors.assert_not_called()
+
+
+def test_get_top_contributors_reads_names_for_top_n_only():
+    """author.name is a lazy user lookup, so only the ranked top N should be touched."""
+    names_read = []
+
+    class CountingAuthor:
+        def __init__(self, login: str):
+            self.login = login
+
+        @property
+        def name(self):
+            names_read.append(self.login)
+            return self.login.title()
+
+    stats = []
+    for i in range(6):
+        contributor = FakeContributorStats("unused", f"user{i}", i * 10, 0)
+        contributor.author = CountingAuthor(f"user{i}")
+        stats.append(contributor)
+    repo = make_mock_repo()
+    repo.get_stats_contributors.return_value = stats
+
+    result = exporter.get_top_contributors(repo, top_n=2)
+
+    assert result == "User5 (user5), User4 (user4)"
+    assert names_read == ["user5", "user4"]
+
+
+def test_get_top_contributors_commits_requests_only_top_n():
+    repo = make_mock_repo(contributors=[(f"User {i}", f"user{i}") for i in range(10)])
+
+    result = exporter.get_top_contributors_commits(repo, top_n=2)
+
+    assert result == "User 0 (user0), User 1 (user1) (commit-based)"
+    repo._requester.requestJsonAndCheck.assert_called_once_with(
+        "GET", f"{repo.url}/contributors", parameters={"per_page": 2}
+    )
+
+
+def test_get_top_contributors_falls_back_without_waiting_on_empty_stats(monkeypatch):
+    """Empty contributor stats should fall back to commit counts immediately, not sleep and re-poll."""
+    repo = make_mock_repo(contributors=[("John Smith", "jsmith")])
+    repo.get_stats_contributors.return_value = []
+    sleep = MagicMock()
+    monkeypatch.setattr(exporter.time, "sleep", sleep)
+
+    result = exporter.get_top_contributors(repo)
+
+    assert result == "John Smith (jsmith) (commit-based)"
+    repo.get_stats_contributors.assert_called_once()
+    sleep.assert_not_called()
+
+
+def test_get_repo_info_rest_path_checks_files_from_tree_listing():
+    """File checks should come from the one git tree listing, with only nested paths fetched."""
+    repo = make_mock_repo(files={"requirements.txt": "numpy", "packrat/packrat.lock": "lock"})
+
+    result = exporter.get_repo_info(repo, existing_df=None)
+
+    assert result["Package Requirements"] == "Yes"
+    assert result[".gitignore"] == "No"
+    repo.get_git_tree.assert_called_once_with(repo.default_branch)
+    repo.get_languages.assert_not_called()  # primary language comes from the listing
+    assert [c.args[0] for c in repo.get_contents.call_args_list] == ["packrat/packrat.lock"]
+
+
+def test_get_repo_info_rest_path_falls_back_when_tree_unavailable():
+    """An empty repo has no tree to list, so file checks use per-path lookups."""
+    repo = make_mock_repo(files={".gitignore": "*.pyc"})
+    repo.get_git_tree.side_effect = GithubException(409, "Git Repository is empty.", None)
+
+    result = exporter.get_repo_info(repo, existing_df=None)
+
+    assert result[".gitignore"] == "Yes"
+    repo.get_contents.assert_any_call(".gitignore")
+
+
+def test_get_repo_info_records_no_errors_for_missing_files():
+    """404s for missing files/README/license and a 409 empty tree are real "No"s, not fetch errors."""
+    repo = make_mock_repo(readme_content=None)
+    repo.get_license.side_effect = GithubException(404, "Not Found", None)
+    repo.get_git_tree.side_effect = GithubException(409, "Git Repository is empty.", None)
+    errors = []
+
+    result = exporter.get_repo_info(repo, existing_df=None, errors=errors)
+
+    assert result["README"] == "No"
+    assert result["License"] == "No"
+    assert errors == []
+
+
+def test_get_repo_info_records_transient_fetch_errors():
+    """A 5xx during a file check falls back to "No" but is recorded, so the row isn't cached."""
+    repo = make_mock_repo()
+    repo.get_git_tree.side_effect = GithubException(502, "Bad Gateway", None)
+    repo.get_contents.side_effect = GithubException(502, "Bad Gateway", None)
+    errors = []
+
+    result = exporter.get_repo_info(repo, existing_df=None, errors=errors)
+
+    assert result[".gitignore"] == "No"
+    assert any(error.startswith(".gitignore:") for error in errors)
+
+
+def test_get_repo_info_fetches_readme_once():
+    """README presence and the README-derived columns should share one fetch."""
+    repo = make_mock_repo(readme_content=FULL_README)
+
+    result = exporter.get_repo_info(repo, existing_df=None)
+
+    assert result["README"] == "Yes"
+    assert result["Model"] == '=HYPERLINK("https://huggingface.co/imageomics/cool-model", "Yes")'
+    repo.get_readme.assert_called_once()
+
+
+def test_is_inactive_uses_given_cutoff():
+    repo = make_mock_repo(updated_at=datetime(2025, 3, 1, tzinfo=timezone.utc))
+
+    assert exporter.is_inactive(repo, cutoff=datetime(2025, 6, 1, tzinfo=timezone.utc)) == "Yes"
+    assert exporter.is_inactive(repo, cutoff=datetime(2025, 1, 1, tzinfo=timezone.utc)) == "No"
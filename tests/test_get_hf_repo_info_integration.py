@@ -8,7 +8,7 @@ doesn't silently change the exported data.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import hf_repo_exporter as exporter
@@ -127,8 +127,7 @@ def test_get_repo_info_matches_expected_output():
         associated_spaces=["imageomics/cool-space"],
     )
 
-    with patch("hf_repo_exporter.hf_hub_download", return_value="/fake/README.md"), \
-         patch("builtins.open", mock_open(read_data=FULL_README)):
+    with patch("hf_repo_exporter.download_readme", return_value=FULL_README):
         result = exporter.get_repo_info(api, repo, "dataset")
 
     expected = {
@@ -175,8 +174,7 @@ def test_get_repo_info_minimal_repo_defaults_to_no_or_na():
         open_pr_count=0,
     )
 
-    with patch("hf_repo_exporter.hf_hub_download", return_value="/fake/README.md"), \
-         patch("builtins.open", mock_open(read_data="Just a plain readme with nothing special.")), \
+    with patch("hf_repo_exporter.download_readme", return_value="Just a plain readme with nothing special."), \
          patch("hf_repo_exporter.HF_ORG_NAME", "imageomics"):
         result = exporter.get_repo_info(api, repo, "model", org_name="imageomics")
 
@@ -213,8 +211,7 @@ def test_get_repo_info_space_type_and_inactive_repo():
     )
     api = make_mock_api(open_pr_count=0)
 
-    with patch("hf_repo_exporter.hf_hub_download", return_value="/fake/README.md"), \
-         patch("builtins.open", mock_open(read_data=FULL_README)):
+    with patch("hf_repo_exporter.download_readme", return_value=FULL_README):
         result = exporter.get_repo_info(api, repo, "space")
 
     assert result["Repository Name"] == '=HYPERLINK("https://huggingface.co/spaces/imageomics/cool-space", "spaces/imageomics/cool-space")'
@@ -237,3 +234,98 @@ def test_get_repo_info_space_type_and_inactive_repo():
     assert result["Associated Models"] == "No"
     assert result["Associated Spaces"] == "No"
     assert result["DOI"] == "No"
+
+
+def test_get_repo_info_fetches_commit_history_once():
+    """Created By and Top 4 Contributors/Curators should share one list_repo_commits call."""
+    repo = make_mock_repo()
+    api = make_mock_api()
+
+    with patch("hf_repo_exporter.download_readme", return_value=FULL_README):
+        result = exporter.get_repo_info(api, repo, "dataset")
+
+    assert result["Created By"] == "janedoe"
+    assert result["Top 4 Contributors/Curators"] == "jsmith, janedoe"
+    api.list_repo_commits.assert_called_once_with(repo_id=repo.id, repo_type="dataset")
+
+
+def test_get_repo_info_uses_org_listing_for_associated_ids():
+    """With the org's listed ids, associated models/spaces need no per-repo Hub search."""
+    repo = make_mock_repo()
+    api = make_mock_api()
+    org_repo_ids = {
+        "model": ["imageomics/cool-dataset-classifier", "imageomics/other-model"],
+        "space": ["imageomics/Cool-Dataset-demo"],
+    }
+
+    with patch("hf_repo_exporter.download_readme", return_value=FULL_README):
+        result = exporter.get_repo_info(api, repo, "dataset", org_repo_ids=org_repo_ids)
+
+    assert result["Associated Models"] == "imageomics/cool-dataset-classifier"
+    assert result["Associated Spaces"] == "imageomics/Cool-Dataset-demo"
+    api.list_models.assert_not_called()
+    api.list_spaces.assert_called_once_with(filter="models:imageomics/cool-dataset")
+
+
+def test_find_ids_containing_matches_org_listing_only():
+    """Only the listed (org) ids are matched; another owner whose id contains the repo id isn't in the listing."""
+    org_ids = ["Imageomics/bar-v2", "Imageomics/other"]
+
+    assert exporter.find_ids_containing("Imageomics/bar", org_ids) == ["Imageomics/bar-v2"]
+    assert exporter.find_ids_containing("Imageomics/bar", org_ids + ["NotImageomics/bar-v2"]) == [
+        "Imageomics/bar-v2",
+        "NotImageomics/bar-v2",
+    ]
+
+
+def test_download_readme_reads_response_in_memory():
+    """README.md is fetched with the shared Hub session (with 429 backoff) rather than through the local file cache."""
+    response = MagicMock(status_code=200, text=FULL_README)
+
+    with patch("hf_repo_exporter.http_backoff", return_value=response) as backoff, \
+         patch("hf_repo_exporter.hf_raise_for_status"):
+        text = exporter.download_readme("imageomics/cool-dataset", "dataset", token="hf_fake")
+
+    assert text == FULL_README
+    method, url = backoff.call_args.args
+    assert method == "GET"
+    assert url == "https://huggingface.co/datasets/imageomics/cool-dataset/resolve/main/README.md"
+    assert backoff.call_args.kwargs["headers"]["authorization"] == "Bearer hf_fake"
+
+
+def test_extract_links_from_text_keeps_first_match_per_label():
+    """The single-pass scan keeps each label's first match and ignores later ones and placeholders."""
+    readme = FULL_README + "\nPaper: https://example.org/later-paper\nhomepage: TBD\n"
+
+    links = exporter.extract_links_from_text(readme)
+
+    assert links == {
+        "Homepage": '=HYPERLINK("https://example.org/cool-dataset", "https://example.org/cool-dataset")',
+        "Repository": '=HYPERLINK("https://github.com/Imageomics/cool-dataset", "https://github.com/Imageomics/cool-dataset")',
+        "Paper": '=HYPERLINK("https://arxiv.org/abs/1234.5678", "https://arxiv.org/abs/1234.5678")',
+    }
+    assert exporter.extract_links_from_text("homepage: TBD") == {"Homepage": "No", "Repository": "No", "Paper": "No"}
+
+
+def test_get_sort_key_uses_display_name_case_insensitively():
+    """Rows sort by the repo-name shown in the sheet, not the HYPERLINK formula."""
+    rows = [
+        {"Repository Name": '=HYPERLINK("https://huggingface.co/imageomics/zebra", "imageomics/zebra")'},
+        {"Repository Name": '=HYPERLINK("https://huggingface.co/imageomics/Beetle", "imageomics/Beetle")'},
+        {"Repository Name": '=HYPERLINK("https://huggingface.co/imageomics/ant", "imageomics/ant")'},
+    ]
+
+    rows.sort(key=exporter.get_sort_key)
+
+    assert [exporter.get_sort_key(row) for row in rows] == ["imageomics/ant", "imageomics/beetle", "imageomics/zebra"]
+
+
+def test_get_repo_info_uses_given_inactive_cutoff():
+    """A cutoff computed once in main() decides Inactive instead of a per-repo now()."""
+    repo = make_mock_repo(last_modified=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    api = make_mock_api()
+
+    with patch("hf_repo_exporter.download_readme", return_value=FULL_README):
+        result = exporter.get_repo_info(api, repo, "dataset", cutoff=datetime(2026, 2, 1, tzinfo=timezone.utc))
+
+    assert result["Inactive"] == "Yes"
@@ -0,0 +1,116 @@
+"""
+Tests for the GitHub exporter's on-disk row cache: rows from the previous run
+are reused only while the repo's pushed_at/default branch/homepage fingerprint and the
+contributor ranking mode are unchanged.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import gh_repo_exporter as exporter
+
+
+def make_repo(*, updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+              pushed_at=datetime(2026, 1, 2, tzinfo=timezone.utc), stars=10):
+    repo = MagicMock()
+    repo.name = "cool-project"
+    repo.full_name = "Imageomics/cool-project"
+    repo.html_url = "https://github.com/Imageomics/cool-project"
+    repo.description = "A cool research project"
+    repo.created_at = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    repo.updated_at = updated_at
+    repo.pushed_at = pushed_at
+    repo.stargazers_count = stars
+    repo.private = False
+    repo.fork = False
+    repo.forks_count = 0
+    repo.archived = False
+    repo.homepage = None
+    repo.default_branch = "main"
+    return repo
+
+
+def make_cache(repo, row):
+    return {repo.full_name: {"fingerprint": exporter.get_repo_fingerprint(repo), "row": row}}
+
+
+def test_cache_hit_reuses_row_and_refreshes_listing_fields():
+    repo = make_repo()
+    cache = make_cache(repo, {"Stars": 3, "Created By": "Jane Doe (janedoe)"})
+    repo.stargazers_count = 12
+
+    result = exporter.get_cached_repo_info(repo, cache)
+
+    assert result["Created By"] == "Jane Doe (janedoe)"
+    assert result["Stars"] == 12
+
+
+def test_cache_miss_when_repo_was_pushed_to():
+    repo = make_repo()
+    cache = make_cache(repo, {"Created By": "Jane Doe (janedoe)"})
+    repo.pushed_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    assert exporter.get_cached_repo_info(repo, cache) is None
+
+
+def test_cache_hit_when_only_updated_at_moved():
+    # Starring a repo bumps updated_at without changing any cached column
+    repo = make_repo()
+    cache = make_cache(repo, {"Created By": "Jane Doe (janedoe)"})
+    repo.updated_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    assert exporter.get_cached_repo_info(repo, cache) is not None
+
+
+def test_cache_miss_when_homepage_changed():
+    repo = make_repo()
+    cache = make_cache(repo, {"Paper Association": "No"})
+    repo.homepage = "https://arxiv.org/abs/1234.5678"
+
+    assert exporter.get_cached_repo_info(repo, cache) is None
+
+
+def test_cache_miss_when_contributor_ranking_mode_changed():
+    repo = make_repo()
+    cache = make_cache(repo, {"Top 4 Contributors (lines of code changes)": "Jane Doe (janedoe)"})
+
+    assert exporter.get_cached_repo_info(repo, cache, with_lines_changed=False) is None
+    assert exporter.get_cached_repo_info(repo, cache, with_lines_changed=True) is not None
+
+
+def test_cache_miss_for_unknown_repo():
+    assert exporter.get_cached_repo_info(make_repo(), {}) is None
+
+
+def test_cache_round_trips_through_disk(tmp_path):
+    repo = make_repo()
+    cache = {
+        "last_full_sweep": "2026-01-05T00:00:00+00:00",
+        "repos": make_cache(repo, {"Created By": "Jane Doe (janedoe)", "Stars": 10}),
+    }
+    path = tmp_path / "nested" / "cache.json"
+
+    exporter.save_repo_cache(str(path), cache)
+
+    assert exporter.load_repo_cache(str(path)) == cache
+
+
+def test_unreadable_cache_loads_as_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    empty = {"last_full_sweep": None, "repos": {}}
+
+    assert exporter.load_repo_cache(str(path)) == empty
+    assert exporter.load_repo_cache(str(tmp_path / "missing.json")) == empty
+
+
+def test_full_sweep_due_without_previous_sweep():
+    assert exporter.is_full_sweep_due({"last_full_sweep": None, "repos": {}}) is True
+
+
+def test_full_sweep_due_after_interval():
+    cache = {"last_full_sweep": "2026-01-01T00:00:00+00:00", "repos": {}}
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert exporter.is_full_sweep_due(cache, now + exporter.FULL_SWEEP_INTERVAL / 2) is False
+    assert exporter.is_full_sweep_due(cache, now + exporter.FULL_SWEEP_INTERVAL) is True
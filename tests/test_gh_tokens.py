@@ -0,0 +1,72 @@
+"""
+Tests the GH_TOKENS helpers in gh_repo_exporter: parsing the token list,
+rebinding a listed repo to another client, and skipping exhausted tokens
+(no network calls).
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from github import Auth, Github
+from github.Repository import Repository
+
+import gh_repo_exporter as exporter
+
+
+def test_parse_tokens_splits_and_dedupes():
+    assert exporter.parse_tokens(" tok-a, tok-b,,tok-a ,") == ["tok-a", "tok-b"]
+
+
+def test_parse_tokens_handles_missing_value():
+    assert exporter.parse_tokens(None) == []
+    assert exporter.parse_tokens("") == []
+
+
+def test_bind_repo_moves_repo_to_other_client_without_refetching():
+    listing_client = Github(auth=Auth.Token("tok-a"))
+    other_client = Github(auth=Auth.Token("tok-b"))
+    raw = {
+        "url": "https://api.github.com/repos/Imageomics/cool-project",
+        "name": "cool-project",
+        "full_name": "Imageomics/cool-project",
+        "stargazers_count": 5,
+    }
+    repo = Repository(listing_client.requester, {}, raw, completed=False)
+
+    rebound = exporter.bind_repo(repo, other_client)
+
+    assert rebound._requester is other_client.requester
+    assert rebound.full_name == "Imageomics/cool-project"
+    assert rebound.stargazers_count == 5
+
+
+def make_client(remaining: int, reset_in: timedelta = timedelta(minutes=30)) -> MagicMock:
+    gh = MagicMock()
+    core = gh.get_rate_limit.return_value.resources.core
+    core.remaining = remaining
+    core.reset = datetime.now(timezone.utc) + reset_in
+    return gh
+
+
+def test_select_clients_skips_nearly_exhausted_tokens():
+    low, high = make_client(remaining=20), make_client(remaining=4000)
+
+    assert exporter.select_clients([low, high]) == [high]
+
+
+def test_select_clients_waits_for_earliest_reset_when_all_exhausted(monkeypatch):
+    later = make_client(remaining=0, reset_in=timedelta(minutes=40))
+    sooner = make_client(remaining=5, reset_in=timedelta(minutes=10))
+    sleep = MagicMock()
+    monkeypatch.setattr(exporter.time, "sleep", sleep)
+
+    assert exporter.select_clients([later, sooner]) == [sooner]
+    waited = sleep.call_args.args[0]
+    assert 9 * 60 < waited <= 10 * 60 + 1
+
+
+def test_select_clients_keeps_clients_whose_limit_cannot_be_read():
+    broken = MagicMock()
+    broken.get_rate_limit.side_effect = RuntimeError("network down")
+
+    assert exporter.select_clients([broken]) == [broken]
@@ -0,0 +1,145 @@
+"""
+Tests gh_repo_exporter.update_google_sheet() against an in-memory fake worksheet,
+checking the resulting cell contents rather than the exact request shapes.
+"""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+import gh_repo_exporter as exporter
+from fake_sheets import FakeWorksheet, open_fake_worksheet
+
+
+HEADER = ["Repository Name", "Notes", "Stars", "README"]
+
+
+@pytest.fixture
+def worksheet():
+    sheet = FakeWorksheet([
+        ["GitHub Repos"],
+        HEADER,
+        ['=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "keep me", "1", "No"],
+    ], title="GH-Repos")
+
+    with open_fake_worksheet(exporter, sheet):
+        yield sheet
+
+
+def test_updates_existing_rows_and_appends_new_ones(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/a-repo", "a-repo")', "Stars": 5, "README": "Yes"},
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "Yes"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+
+    existing = worksheet.rows[2]
+    assert existing[0] == '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")'
+    assert existing[1] == "keep me"  # column not exported is left untouched
+    assert existing[2:] == [7, "Yes"]
+
+    appended = worksheet.rows[3]
+    assert appended[0] == '=HYPERLINK("https://github.com/Imageomics/a-repo", "a-repo")'
+    assert appended[2:] == [5, "Yes"]
+
+
+def test_adds_conditional_format_for_present_columns_only(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "No"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+
+    formatted_columns = {
+        rng["startColumnIndex"]
+        for request in worksheet.spreadsheet.format_requests
+        for rng in request["addConditionalFormatRule"]["rule"]["ranges"]
+    }
+    assert formatted_columns == {HEADER.index("README")}
+
+
+def test_rerun_does_not_duplicate_conditional_formats(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "No"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+
+    assert len(worksheet.spreadsheet.conditional_formats) == 1
+
+
+def test_rerun_with_more_repos_sends_no_format_requests(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "No"},
+    ])
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+    sent = len(worksheet.spreadsheet.format_requests)
+
+    grown = pd.concat([df, pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/c-repo", "c-repo")', "Stars": 1, "README": "No"},
+    ])])
+    exporter.update_google_sheet(grown, "sheet-id", "GH-Repos", "creds.json")
+
+    assert len(worksheet.spreadsheet.format_requests) == sent
+    assert len(worksheet.spreadsheet.conditional_formats) == 1
+
+
+def test_reuses_worksheet_and_values_read_by_main(worksheet):
+    existing = worksheet.get_all_values()
+    worksheet.get_all_values = MagicMock(side_effect=AssertionError("sheet re-read"))
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 9, "README": "Yes"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json", worksheet, existing)
+
+    exporter.gspread.authorize.assert_not_called()
+    assert worksheet.rows[2][2:] == [9, "Yes"]
+
+
+def test_consecutive_rows_share_one_range_per_column_run(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "Yes"},
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/c-repo", "c-repo")', "Stars": 2, "README": "No"},
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/d-repo", "d-repo")', "Stars": 3, "README": "Yes"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+
+    # Rows 3-5 (one existing, two appended); "Notes" splits the header into two column runs
+    assert worksheet.spreadsheet.value_ranges == ["'GH-Repos'!A3:A5", "'GH-Repos'!C3:D5"]
+    assert [row[2:] for row in worksheet.rows[2:]] == [[7, "Yes"], [2, "No"], [3, "Yes"]]
+    assert worksheet.rows[2][1] == "keep me"
+
+
+def test_replaces_stale_bounded_rules_and_keeps_unrelated_ones(worksheet):
+    readme_col = HEADER.index("README")
+    bounded = {
+        "ranges": [{"sheetId": 0, "startRowIndex": 2, "endRowIndex": 3,
+                    "startColumnIndex": readme_col, "endColumnIndex": readme_col + 1}],
+        "booleanRule": {
+            "condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": "No"}]},
+            "format": {"backgroundColor": {"red": 1, "green": 0.5, "blue": 0.5}},
+        },
+    }
+    unrelated = {
+        "ranges": [{"sheetId": 0, "startRowIndex": 2, "startColumnIndex": 1, "endColumnIndex": 2}],
+        "booleanRule": {
+            "condition": {"type": "TEXT_CONTAINS", "values": [{"userEnteredValue": "todo"}]},
+            "format": {"backgroundColor": {"red": 0.2, "green": 0.2, "blue": 1}},
+        },
+    }
+    worksheet.spreadsheet.conditional_formats = [bounded, dict(bounded), unrelated]
+    df = pd.DataFrame([
+        {"Repository Name": '=HYPERLINK("https://github.com/Imageomics/b-repo", "b-repo")', "Stars": 7, "README": "No"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "GH-Repos", "creds.json")
+
+    rules = worksheet.spreadsheet.conditional_formats
+    assert unrelated in rules
+    assert len(rules) == 2
+    assert all("endRowIndex" not in rule["ranges"][0] for rule in rules)
@@ -0,0 +1,146 @@
+"""
+Tests for the Hugging Face exporter's on-disk cache: the history and README columns
+from the previous run are reused only while the repo's lastModified is unchanged.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from huggingface_hub.utils import EntryNotFoundError
+
+import hf_repo_exporter as exporter
+
+
+HISTORY = {
+    "Created By": "janedoe",
+    "Top 4 Contributors/Curators": "jsmith, janedoe",
+    "Homepage": "No",
+    "Repo": "No",
+    "Paper": "No",
+}
+
+
+def make_repo(*, last_modified=datetime(2026, 1, 1, tzinfo=timezone.utc)):
+    repo = MagicMock()
+    repo.id = "imageomics/cool-dataset"
+    repo.lastModified = last_modified
+    return repo
+
+
+def make_cache(repo, repo_type="dataset", fields=HISTORY):
+    return {
+        exporter.get_repo_cache_key(repo, repo_type): {
+            "fingerprint": exporter.get_repo_fingerprint(repo),
+            "fields": dict(fields),
+        }
+    }
+
+
+def test_cache_hit_for_unmodified_repo():
+    repo = make_repo()
+
+    assert exporter.get_cached_history_fields(repo, "dataset", make_cache(repo)) == HISTORY
+
+
+def test_cache_miss_when_repo_was_modified():
+    repo = make_repo()
+    cache = make_cache(repo)
+    repo.lastModified = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    assert exporter.get_cached_history_fields(repo, "dataset", cache) is None
+
+
+def test_cache_miss_for_same_id_with_another_repo_type():
+    repo = make_repo()
+
+    assert exporter.get_cached_history_fields(repo, "model", make_cache(repo)) is None
+
+
+def test_cached_history_skips_readme_and_commit_fetches():
+    repo = make_repo()
+    repo.private = False
+    repo.likes = 3
+    repo.tags = []
+    repo.doi = None
+    repo.license = None
+    repo.cardData = repo.card_data = {"license": "mit"}
+    api = MagicMock()
+    api.get_repo_discussions.return_value = []
+    api.list_models.return_value = []
+    api.list_spaces.return_value = []
+
+    result = exporter.get_repo_info(api, repo, "dataset", history=HISTORY)
+
+    api.list_repo_commits.assert_not_called()
+    assert result["Created By"] == "janedoe"
+    assert result["Likes"] == 3
+
+
+def make_history_api():
+    api = MagicMock()
+    api.list_repo_commits.return_value = []
+    return api
+
+
+def test_failed_readme_download_is_not_cached():
+    repo = make_repo()
+    api = make_history_api()
+
+    with patch("hf_repo_exporter.download_readme", side_effect=TimeoutError("read timed out")):
+        history, complete = exporter.get_history_fields(api, repo, "dataset", org_name="imageomics")
+
+    new_cache = {}
+    exporter.update_repo_cache(new_cache, {}, repo, "dataset", history, complete)
+
+    assert complete is False
+    assert new_cache == {}
+
+
+def test_failed_fetch_keeps_previous_cache_entry():
+    repo = make_repo()
+    previous_cache = make_cache(repo)
+    repo.lastModified = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    api = make_history_api()
+    api.list_repo_commits.side_effect = TimeoutError("read timed out")
+
+    with patch("hf_repo_exporter.download_readme", return_value=""):
+        history, complete = exporter.get_history_fields(api, repo, "dataset", org_name="imageomics")
+
+    new_cache = {}
+    exporter.update_repo_cache(new_cache, previous_cache, repo, "dataset", history, complete)
+
+    assert complete is False
+    assert new_cache == previous_cache
+
+
+def test_missing_readme_is_cached():
+    repo = make_repo()
+    api = make_history_api()
+
+    with patch("hf_repo_exporter.download_readme", side_effect=EntryNotFoundError("README.md not found")):
+        history, complete = exporter.get_history_fields(api, repo, "dataset", org_name="imageomics")
+
+    new_cache = {}
+    exporter.update_repo_cache(new_cache, {}, repo, "dataset", history, complete)
+
+    assert complete is True
+    assert exporter.get_cached_history_fields(repo, "dataset", new_cache) == history
+
+
+def test_cache_round_trips_through_disk(tmp_path):
+    repo = make_repo()
+    cache = {"last_full_sweep": "2026-01-05T00:00:00+00:00", "repos": make_cache(repo)}
+    path = tmp_path / "nested" / "cache.json"
+
+    exporter.save_repo_cache(str(path), cache)
+
+    assert exporter.load_repo_cache(str(path)) == cache
+
+
+def test_full_sweep_due_after_interval():
+    cache = {"last_full_sweep": "2026-01-01T00:00:00+00:00", "repos": {}}
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert exporter.is_full_sweep_due({"last_full_sweep": None, "repos": {}}) is True
+    assert exporter.is_full_sweep_due(cache, now + exporter.FULL_SWEEP_INTERVAL / 2) is False
+    assert exporter.is_full_sweep_due(cache, now + exporter.FULL_SWEEP_INTERVAL) is True
@@ -0,0 +1,105 @@
+"""
+Tests hf_repo_exporter.update_google_sheet() against an in-memory fake worksheet,
+checking the resulting cell contents rather than the exact request shapes.
+"""
+
+import pandas as pd
+import pytest
+
+import hf_repo_exporter as exporter
+from fake_sheets import FakeWorksheet, open_fake_worksheet
+
+
+HEADER = ["Repository Name", "Notes", "Likes", "README", "License", "DOI"]
+
+
+def hf_name(repo_id: str) -> str:
+    return f'=HYPERLINK("https://huggingface.co/datasets/{repo_id}", "datasets/{repo_id}")'
+
+
+@pytest.fixture
+def worksheet():
+    sheet = FakeWorksheet([
+        ["Hugging Face Repos"],
+        HEADER,
+        [hf_name("imageomics/b-data"), "keep me", "1", "No"],
+    ], title="HF-Repos")
+
+    with open_fake_worksheet(exporter, sheet):
+        yield sheet
+
+
+def test_updates_existing_rows_and_appends_new_ones(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": hf_name("imageomics/a-data"), "Likes": 5, "README": "Yes"},
+        {"Repository Name": hf_name("imageomics/b-data"), "Likes": 7, "README": "Yes"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "HF-Repos", "creds.json")
+
+    existing = worksheet.rows[2]
+    assert existing[0] == hf_name("imageomics/b-data")
+    assert existing[1] == "keep me"  # column not exported is left untouched
+    assert existing[2:] == ["7", "Yes"]
+
+    appended = worksheet.rows[3]
+    assert appended[0] == hf_name("imageomics/a-data")
+    assert appended[2:] == ["5", "Yes"]
+
+
+def test_consecutive_rows_share_one_range_per_column_run(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": hf_name("imageomics/b-data"), "Likes": 7, "README": "Yes"},
+        {"Repository Name": hf_name("imageomics/c-data"), "Likes": 2, "README": "No"},
+        {"Repository Name": hf_name("imageomics/d-data"), "Likes": 3, "README": "Yes"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "HF-Repos", "creds.json")
+
+    # Rows 3-5 (one existing, two appended); "Notes" splits the header into two column runs
+    assert worksheet.spreadsheet.value_ranges == ["'HF-Repos'!A3:A5", "'HF-Repos'!C3:D5"]
+    assert [row[2:] for row in worksheet.rows[2:]] == [["7", "Yes"], ["2", "No"], ["3", "Yes"]]
+    assert worksheet.rows[2][1] == "keep me"
+
+
+def test_one_conditional_format_rule_per_color(worksheet):
+    df = pd.DataFrame([
+        {"Repository Name": hf_name("imageomics/b-data"), "Likes": 7, "README": "No", "License": "No", "DOI": "No"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "HF-Repos", "creds.json")
+
+    rules = worksheet.spreadsheet.conditional_formats
+    columns_by_color = {
+        rule["booleanRule"]["format"]["backgroundColor"]["green"]: sorted(rng["startColumnIndex"] for rng in rule["ranges"])
+        for rule in rules
+    }
+    assert columns_by_color == {
+        exporter.RED["green"]: [HEADER.index("README"), HEADER.index("License")],
+        exporter.YELLOW["green"]: [HEADER.index("DOI")],
+    }
+
+
+def test_rerun_replaces_stale_bounded_rules_and_sends_no_format_requests(worksheet):
+    readme_col = HEADER.index("README")
+    bounded = {
+        "ranges": [{"sheetId": 0, "startRowIndex": 2, "endRowIndex": 3,
+                    "startColumnIndex": readme_col, "endColumnIndex": readme_col + 1}],
+        "booleanRule": {
+            "condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": "No"}]},
+            "format": {"backgroundColor": {"red": 1, "green": 0.5, "blue": 0.5}},
+        },
+    }
+    worksheet.spreadsheet.conditional_formats = [bounded, dict(bounded)]
+    df = pd.DataFrame([
+        {"Repository Name": hf_name("imageomics/b-data"), "Likes": 7, "README": "No", "License": "No", "DOI": "No"},
+    ])
+
+    exporter.update_google_sheet(df, "sheet-id", "HF-Repos", "creds.json")
+    sent = len(worksheet.spreadsheet.format_requests)
+    exporter.update_google_sheet(df, "sheet-id", "HF-Repos", "creds.json")
+
+    rules = worksheet.spreadsheet.conditional_formats
+    assert len(rules) == 2
+    assert all("endRowIndex" not in rng for rule in rules for rng in rule["ranges"])
+    assert len(worksheet.spreadsheet.format_requests) == sent
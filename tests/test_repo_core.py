@@ -27,21 +27,19 @@ class TestGetRepoCreator(unittest.TestCase):
         repo.created_at = datetime.strptime(created_at_str, "%Y-%m-%d")
         return repo
 
-    def _make_commits_mock(self, author_name: str, author_login: str,
-                           total: int = 1, per_page: int = 30) -> MagicMock:
+    def _make_commits_mock(self, repo: MagicMock, author_name: str, author_login: str,
+                           total: int = 1) -> MagicMock:
         """
-        Build a mock commits object whose get_page() returns a single commit
-        with the given author. Used to wire up the API fallback path.
+        Wire up the API fallback path: get_commits() reports `total` commits and the
+        single-commit page request returns one commit with the given author.
         """
         commits = MagicMock()
         commits.totalCount = total
-
-        author = MagicMock()
-        author.name = author_name
-        author.login = author_login
-        commit = MagicMock()
-        commit.author = author
-        commits.get_page.return_value = [commit]
+        repo.get_commits.return_value = commits
+        repo._requester = MagicMock()
+        repo._requester.requestJsonAndCheck.return_value = (
+            {}, [{"sha": "abc123", "author": {"login": author_login, "name": author_name}}]
+        )
         return commits
 
     def _dummy_existing_df(self, rows: list[dict]) -> pd.DataFrame:
@@ -73,10 +71,7 @@ class TestGetRepoCreator(unittest.TestCase):
             {"Repository Name": "my-repo", "Date Created": "2024-03-01", "Created By": "N/A"},
         ])
         repo = self._make_mock_repo("my-repo", "2024-03-01")
-        commits = self._make_commits_mock("Carol", "carol99")
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "Carol", "carol99")
 
         result = get_repo_creator(repo, existing_df)
 
@@ -89,10 +84,7 @@ class TestGetRepoCreator(unittest.TestCase):
             {"Repository Name": "my-repo", "Date Created": "2024-03-01", "Created By": float("nan")},
         ])
         repo = self._make_mock_repo("my-repo", "2024-03-01")
-        commits = self._make_commits_mock("Dave", "dave42")
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "Dave", "dave42")
 
         result = get_repo_creator(repo, existing_df)
 
@@ -106,10 +98,7 @@ class TestGetRepoCreator(unittest.TestCase):
             {"Repository Name": "other-repo", "Date Created": "2024-03-01", "Created By": "Eve (eve)"},
         ])
         repo = self._make_mock_repo("my-repo", "2024-03-01")
-        commits = self._make_commits_mock("Frank", "frankdev")
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "Frank", "frankdev")
 
         result = get_repo_creator(repo, existing_df)
 
@@ -120,10 +109,7 @@ class TestGetRepoCreator(unittest.TestCase):
         # Empty DataFrame (e.g. first-ever run, sheet has no data yet).
         existing_df = pd.DataFrame(columns=["Repository Name", "Date Created", "Created By"])
         repo = self._make_mock_repo("brand-new-repo", "2024-06-01")
-        commits = self._make_commits_mock("Grace", "grace")
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "Grace", "grace")
 
         result = get_repo_creator(repo, existing_df)
 
@@ -134,46 +120,34 @@ class TestGetRepoCreator(unittest.TestCase):
         # Should fall through to commit history, not raise or return "N/A" silently.
         existing_df = pd.DataFrame([{"Repo": "my-repo", "Created": "2024-03-01"}])
         repo = self._make_mock_repo("my-repo", "2024-03-01")
-        commits = self._make_commits_mock("Henry", "henry99")
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "Henry", "henry99")
 
         result = get_repo_creator(repo, existing_df)
 
         self.assertEqual(result, "Henry (henry99)")
         repo.get_commits.assert_called()
 
-    def test_correct_last_page_index_is_requested(self):
-        # Critical math check: with 95 commits and 30 per page,
-        # last_page = (95-1)//30 = 3. Verify get_page(3) is called.
-        total, per_page = 95, 30
+    def test_requests_single_oldest_commit(self):
+        # With per_page=1, page N holds the Nth-newest commit: for 95 commits
+        # the oldest is page 95, fetched on its own rather than as a full page.
+        total = 95
         repo = self._make_mock_repo("my-repo", "2024-03-01")
-        commits = self._make_commits_mock("Dave", "dave", total=total, per_page=per_page)
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = per_page
+        self._make_commits_mock(repo, "Dave", "dave", total=total)
 
         result = get_repo_creator(repo, None)
-        
-        self.assertEqual(result, "Dave (dave)")
 
-        expected_page = (total - 1) // per_page  # = 3
-        commits.get_page.assert_called_once_with(expected_page)
+        self.assertEqual(result, "Dave (dave)")
+        repo._requester.requestJsonAndCheck.assert_called_once_with(
+            "GET", f"{repo.url}/commits", parameters={"per_page": 1, "page": total}
+        )
 
     def test_returns_na_when_commit_author_is_none(self):
         # Oldest commit has no author (e.g. deleted GitHub account or user changed their GitHub name/display name).
         existing_df = self._dummy_existing_df([])
         repo = self._make_mock_repo("ghost-repo", "2024-01-01")
 
-        commits = MagicMock()
-        commits.totalCount = 1
-        commit = MagicMock()
-        commit.author = None
-        commits.get_page.return_value = [commit]
-        repo.get_commits.return_value = commits
-        repo._requester = MagicMock()
-        repo._requester.per_page = 30
+        self._make_commits_mock(repo, "unused", "unused")
+        repo._requester.requestJsonAndCheck.return_value = ({}, [{"sha": "abc123", "author": None}])
 
         result = get_repo_creator(repo, existing_df)
 